@@ -22,13 +22,14 @@ import math
 from dataclasses import dataclass, field, asdict
 from typing import List, Dict, Optional
 from datetime import datetime
+from types import MappingProxyType
 from logger import get_logger
 from agent.strategies import get_strategy
 
 log = get_logger("agent.scorer")
 
-# Signal weights (must sum to 100)
-WEIGHTS = {
+# Signal weights (must sum to 100); read-only
+WEIGHTS = MappingProxyType({
     'gex_regime':       20,
     'wall_proximity':   15,
     'pc_skew':          12,
@@ -38,7 +39,7 @@ WEIGHTS = {
     'gex_momentum':      8,
     'skew_momentum':     5,
     'dte_conviction':    8,
-}
+})
 
 
 @dataclass
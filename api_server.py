@@ -13,20 +13,48 @@ Usage:
 import os
 import json
 import re
+from collections import defaultdict
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Optional
 
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from logger import get_logger
+from json_utils import dumps, loads
 from config import load_config
 
 log = get_logger("api_server")
 
-app = FastAPI(title="Options Trading Dashboard API", version="2.0")
+
+class JSONBytesResponse(Response):
+    """JSON response serialized by json_utils.dumps (orjson when installed).
+
+    NaN greeks are written as null instead of failing the request.
+    """
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load data on server start."""
+    from db.models import init_db
+    try:
+        init_db()
+    except Exception as e:
+        log.warning("Database init failed: %s", e)
+    refresh_data_store()
+    yield
+
+
+app = FastAPI(title="Options Trading Dashboard API", version="2.0", lifespan=lifespan,
+              default_response_class=JSONBytesResponse)
 
 # CORS for local development
 app.add_middleware(
@@ -61,12 +89,33 @@ def _load_js_data(filepath: str, var_name: str):
         pattern = rf'const\s+{var_name}\s*=\s*(\[.*\]|{{.*}})\s*;'
         match = re.search(pattern, content, re.DOTALL)
         if match:
-            return json.loads(match.group(1))
+            return loads(match.group(1))
     except Exception as e:
         log.warning("Failed to parse %s: %s", filepath, e)
     return None
 
 
+# option_data grouped by Symbol, paired with the list it was built from.
+# option_data is only ever replaced (never mutated in place), so the index
+# is rebuilt lazily the first time a new list is seen.
+_options_index = (None, {})
+
+
+def _contracts_by_ticker():
+    """Return {ticker: [contracts]} for the current option_data."""
+    global _options_index
+    contracts = _data_store['option_data']
+    source, by_ticker = _options_index
+    if source is not contracts:
+        grouped = defaultdict(list)
+        for c in contracts:
+            if c.get('Symbol'):
+                grouped[c['Symbol']].append(c)
+        by_ticker = dict(grouped)
+        _options_index = (contracts, by_ticker)
+    return by_ticker
+
+
 def refresh_data_store():
     """Reload data from JS files into memory. Called after each fetch cycle."""
     # Option data (heatmap)
@@ -132,7 +181,7 @@ def list_tickers():
     analytics = _data_store.get('analytics_data', {})
     tickers = list(analytics.get('data', {}).keys()) if analytics else []
     if not tickers:
-        tickers = sorted(set(c.get('Symbol', '') for c in _data_store['option_data'] if c.get('Symbol')))
+        tickers = sorted(_contracts_by_ticker())
     return {"tickers": tickers}
 
 
@@ -140,10 +189,12 @@ def list_tickers():
 def get_options(ticker: str):
     """Get option contracts for a specific ticker (for heatmap)."""
     ticker = ticker.upper()
-    contracts = [c for c in _data_store['option_data'] if c.get('Symbol') == ticker]
+    contracts = _contracts_by_ticker().get(ticker)
     if not contracts:
         raise HTTPException(status_code=404, detail=f"No data for ticker {ticker}")
-    return {"ticker": ticker, "contracts": contracts, "count": len(contracts)}
+    # Contracts are plain JSON types already; returning the response directly
+    # skips FastAPI's per-value jsonable_encoder pass over the whole chain
+    return JSONBytesResponse({"ticker": ticker, "contracts": contracts, "count": len(contracts)})
 
 
 @app.get("/api/analytics/{ticker}")
@@ -269,19 +320,6 @@ def serve_static(filename: str):
     raise HTTPException(status_code=404, detail="File not found")
 
 
-# --- Startup ---
-
-@app.on_event("startup")
-def startup():
-    """Load data on server start."""
-    from db.models import init_db
-    try:
-        init_db()
-    except Exception as e:
-        log.warning("Database init failed: %s", e)
-    refresh_data_store()
-
-
 if __name__ == "__main__":
     import uvicorn
     cfg = load_config()
@@ -24,6 +24,9 @@ class FetcherConfig:
     max_tickers_per_cycle: int = 100
     api_retry_attempts: int = 3
     api_retry_delay: int = 2
+    parallel_workers: int = 5
+    max_requests_per_minute: int = 120
+    strike_count: int = 100
 
 
 @dataclass
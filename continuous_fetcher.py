@@ -8,8 +8,9 @@ import time
 import json
 from datetime import datetime
 from ticker_list import TOP_100_LIQUID_OPTIONS
-from fetch_options_data import get_client, fetch_option_data
+from fetch_options_data import get_client, fetch_tickers, aggregate_strikes, save_analytics_data
 from logger import get_logger
+from json_utils import dumps, loads
 from config import load_config
 import os
 
@@ -18,6 +19,7 @@ cfg = load_config()
 
 REFRESH_INTERVAL = cfg.fetcher.refresh_interval
 MAX_TICKERS_PER_CYCLE = cfg.fetcher.max_tickers_per_cycle
+PARALLEL_WORKERS = cfg.fetcher.parallel_workers
 
 # Store previous gamma data for alert comparisons
 _previous_gamma_data = None
@@ -28,72 +30,13 @@ def save_option_data(all_data):
     timestamp = datetime.now().isoformat()
 
     # Generate JavaScript file
-    js_content = f"// Auto-generated at {timestamp}\nconst OPTION_DATA = {json.dumps(all_data, indent=2)};\n"
+    header = f"// Auto-generated at {timestamp}\n"
 
-    with open('option_data.js', 'w', encoding='utf-8') as f:
-        f.write(js_content)
+    with open('option_data.js', 'wb') as f:
+        f.write(header.encode('utf-8') + b"const OPTION_DATA = " + dumps(all_data, indent=True) + b";\n")
 
     log.info("Saved %d contracts to option_data.js", len(all_data))
 
-def save_analytics_data(all_data):
-    """Generate analytics data (all_tickers_data.js) from options data"""
-    timestamp = datetime.now().isoformat()
-
-    # Aggregate data by ticker and strike for analytics view
-    ticker_data = {}
-
-    for contract in all_data:
-        ticker = contract['Symbol']
-        strike = contract['Strike']
-        underlying_price = contract['UnderlyingPrice']
-
-        if ticker not in ticker_data:
-            ticker_data[ticker] = {
-                'price': underlying_price,
-                'timestamp': timestamp,
-                'strikes': {}
-            }
-
-        if strike not in ticker_data[ticker]['strikes']:
-            ticker_data[ticker]['strikes'][strike] = {
-                'total_delta': 0,
-                'total_gamma': 0,
-                'total_theta': 0,
-                'total_vega': 0,
-                'oi': 0,
-                'volume': 0
-            }
-
-        # Aggregate Greeks weighted by open interest
-        oi = contract.get('OpenInterest', 0)
-        volume = contract.get('Volume', 0)
-
-        ticker_data[ticker]['strikes'][strike]['total_delta'] += (contract.get('Delta', 0) * oi)
-        ticker_data[ticker]['strikes'][strike]['total_gamma'] += (contract.get('Gamma', 0) * oi)
-        ticker_data[ticker]['strikes'][strike]['total_theta'] += (contract.get('Theta', 0) * oi)
-        ticker_data[ticker]['strikes'][strike]['total_vega'] += (contract.get('Vega', 0) * oi)
-        ticker_data[ticker]['strikes'][strike]['oi'] += oi
-        ticker_data[ticker]['strikes'][strike]['volume'] += volume
-
-    # Build output structure
-    output = {
-        'metadata': {
-            'total_tickers': len(ticker_data),
-            'generated_at': timestamp,
-            'tickers': list(ticker_data.keys())
-        },
-        'data': ticker_data
-    }
-
-    # Save as JavaScript file
-    js_content = f"// Auto-generated ticker data\n// Generated: {timestamp}\n// Total tickers: {len(ticker_data)}\n\n"
-    js_content += f"const TICKER_DATA = {json.dumps(output, indent=2)};\n"
-
-    with open('all_tickers_data.js', 'w', encoding='utf-8') as f:
-        f.write(js_content)
-
-    log.info("Saved %d tickers to all_tickers_data.js", len(ticker_data))
-
 def save_metadata(ticker_count, contract_count, errors):
     """Save fetch metadata"""
     metadata = {
@@ -133,8 +76,8 @@ def save_price_history(all_data):
     history = {}
     if os.path.exists(history_file):
         try:
-            with open(history_file, 'r', encoding='utf-8') as f:
-                history = json.load(f)
+            with open(history_file, 'rb') as f:
+                history = loads(f.read())
         except (json.JSONDecodeError, IOError):
             history = {}
 
@@ -142,11 +85,8 @@ def save_price_history(all_data):
     cutoff = unix_ts - 432000
 
     for ticker, price in ticker_prices.items():
-        if ticker not in history:
-            history[ticker] = []
-
         # Append new data point
-        history[ticker].append({
+        history.setdefault(ticker, []).append({
             'time': unix_ts,
             'value': round(price, 2)
         })
@@ -154,14 +94,18 @@ def save_price_history(all_data):
         # Prune old entries
         history[ticker] = [p for p in history[ticker] if p['time'] > cutoff]
 
+    # Serialize once; the same bytes go to the JSON file and the JS wrapper
+    history_json = dumps(history)
+
     # Save as JSON
-    with open(history_file, 'w', encoding='utf-8') as f:
-        json.dump(history, f)
+    with open(history_file, 'wb') as f:
+        f.write(history_json)
 
     # Also save as JS for direct browser loading
-    js_content = f"// Auto-generated price history at {timestamp}\nconst PRICE_HISTORY = {json.dumps(history)};\n"
-    with open('price_history.js', 'w', encoding='utf-8') as f:
-        f.write(js_content)
+    with open('price_history.js', 'wb') as f:
+        f.write(f"// Auto-generated price history at {timestamp}\nconst PRICE_HISTORY = ".encode('utf-8'))
+        f.write(history_json)
+        f.write(b";\n")
 
     log.info("Saved price history for %d tickers", len(ticker_prices))
 
@@ -216,31 +160,7 @@ def _run_recommendations(all_data, gamma_data):
         from agent.scorer import score_all_tickers, save_recommendations
 
         # Build analytics dict from raw contracts
-        analytics = {}
-        for c in all_data:
-            ticker = c.get('Symbol', '')
-            strike = c.get('Strike', 0)
-            if not ticker:
-                continue
-            if ticker not in analytics:
-                analytics[ticker] = {
-                    'price': c.get('UnderlyingPrice', 0),
-                    'strikes': {}
-                }
-            if strike not in analytics[ticker]['strikes']:
-                analytics[ticker]['strikes'][strike] = {
-                    'total_gamma': 0, 'total_delta': 0,
-                    'total_vega': 0, 'total_theta': 0,
-                    'oi': 0, 'volume': 0
-                }
-            oi = c.get('OpenInterest', 0) or 0
-            sd = analytics[ticker]['strikes'][strike]
-            sd['total_gamma'] += (c.get('Gamma', 0) * oi)
-            sd['total_delta'] += (c.get('Delta', 0) * oi)
-            sd['total_vega']  += (c.get('Vega', 0) * oi)
-            sd['total_theta'] += (c.get('Theta', 0) * oi)
-            sd['oi'] += oi
-            sd['volume'] += (c.get('Volume', 0) or 0)
+        analytics = aggregate_strikes(all_data)
 
         recs = score_all_tickers(all_data, analytics, gamma_data or {})
         save_recommendations(recs)
@@ -260,8 +180,6 @@ def _refresh_api_store():
 
 def fetch_all_tickers():
     """Fetch data for all tickers using parallel workers"""
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-
     log.info("=" * 70)
     log.info("Data Fetch Cycle Started: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
     log.info("=" * 70)
@@ -271,39 +189,14 @@ def fetch_all_tickers():
         log.error("Could not initialize Schwab client")
         return
 
-    all_data = []
-    errors = []
-
     # Limit tickers to avoid overwhelming API
     tickers_to_fetch = TOP_100_LIQUID_OPTIONS[:MAX_TICKERS_PER_CYCLE]
     total_tickers = len(tickers_to_fetch)
-    PARALLEL_WORKERS = 5
 
     log.info("Fetching %d tickers with %d parallel workers...", total_tickers, PARALLEL_WORKERS)
     start_time = time.time()
 
-    def _fetch_one(ticker):
-        try:
-            ticker_data = fetch_option_data(client, ticker)
-            return ticker, ticker_data or []
-        except Exception as e:
-            log.error("  Error fetching %s: %s", ticker, e)
-            return ticker, []
-
-    with ThreadPoolExecutor(max_workers=PARALLEL_WORKERS) as executor:
-        futures = {executor.submit(_fetch_one, t): t for t in tickers_to_fetch}
-
-        for future in as_completed(futures):
-            ticker = futures[future]
-            try:
-                _, ticker_data = future.result()
-                if ticker_data:
-                    all_data.extend(ticker_data)
-                else:
-                    errors.append(ticker)
-            except Exception as e:
-                log.error("Future error for %s: %s", ticker, e)
-                errors.append(ticker)
+    all_data, errors = fetch_tickers(client, tickers_to_fetch, workers=PARALLEL_WORKERS)
 
     elapsed = time.time() - start_time
     log.info("Fetched %d contracts in %.1fs (%d errors)", len(all_data), elapsed, len(errors))
@@ -12,6 +12,12 @@ Outputs:
 import json
 import re
 import os
+from collections import defaultdict
+
+from json_utils import loads
+
+# GEX sign per option type: calls add dealer gamma, puts subtract it
+_SIGN_TABLE = {'CALL': 1.0, 'PUT': -1.0}
 
 
 def load_option_data(filepath='option_data.js'):
@@ -25,7 +31,7 @@ def load_option_data(filepath='option_data.js'):
     if not match:
         raise ValueError("Could not find OPTION_DATA in option_data.js")
 
-    data = json.loads(match.group(1))
+    data = loads(match.group(1))
     print(f"  Loaded {len(data):,} contracts")
     return data
 
@@ -42,7 +48,7 @@ def compute_star_levels(contracts):
     Returns dict: { ticker: { price, max_positive_gamma_strike, max_negative_gamma_strike, ... } }
     """
     # Group contracts by ticker
-    by_ticker = {}
+    by_ticker = defaultdict(list)
     ticker_prices = {}
 
     for c in contracts:
@@ -54,8 +60,7 @@ def compute_star_levels(contracts):
         if spot == 0:
             continue
 
-        if ticker not in by_ticker:
-            by_ticker[ticker] = []
+        if ticker not in ticker_prices:
             ticker_prices[ticker] = spot
         by_ticker[ticker].append(c)
 
@@ -63,35 +68,25 @@ def compute_star_levels(contracts):
 
     for ticker, ticker_contracts in by_ticker.items():
         spot = ticker_prices[ticker]
+        # Heatmap formula: GEX = Gamma × OI × 100 × SpotPrice² × 0.01; the
+        # 100 × 0.01 cancels, and SpotPrice² is fixed for the ticker
+        spot_sq = spot * spot
 
         # Build per-cell (strike, expiration) net GEX — same as heatmap
-        cell_gex = {}  # (strike, exp) -> net GEX
+        cell_gex = defaultdict(float)  # (strike, exp) -> net GEX
 
         for c in ticker_contracts:
             strike = c.get('Strike', 0)
             exp = c.get('Expiration', '')
             gamma = c.get('Gamma', 0) or 0
             oi = c.get('OpenInterest', 0) or 0
-            opt_type = c.get('Type', '')
-
-            if strike == 0:
-                continue
-
-            # Heatmap formula: GEX = Gamma × OI × 100 × SpotPrice² × 0.01
-            exposure = gamma * oi * 100 * spot * spot * 0.01
-
             # Calls positive, puts negative
-            if opt_type == 'CALL':
-                net = exposure
-            elif opt_type == 'PUT':
-                net = -exposure
-            else:
+            sign = _SIGN_TABLE.get(c.get('Type'))
+
+            if strike == 0 or sign is None:
                 continue
 
-            key = (strike, exp)
-            if key not in cell_gex:
-                cell_gex[key] = 0
-            cell_gex[key] += net
+            cell_gex[strike, exp] += sign * gamma * oi * spot_sq
 
         # Find the cell with max positive and max negative GEX (the stars)
         max_pos_strike = None
@@ -6,26 +6,20 @@ Supports parallel fetching for faster data refresh.
 """
 
 import schwab
-import json
 import os
 import csv
 import time
-import socket
+import threading
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 from logger import get_logger
+from json_utils import dumps
 
 log = get_logger("fetch_options_data")
 
-# --- DNS MONKEY PATCH ---
 # Fix for system-specific getaddrinfo failure on api.schwabapi.com
-original_getaddrinfo = socket.getaddrinfo
-def patched_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
-    if host == 'api.schwabapi.com':
-        return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('69.192.139.216', port))]
-    return original_getaddrinfo(host, port, family, type, proto, flags)
-socket.getaddrinfo = patched_getaddrinfo
-# ------------------------
+import net_patches  # noqa: F401
 
 # Load environment variables
 load_dotenv()
@@ -50,20 +44,176 @@ def _get_retry_config():
         return 3, 2
 
 
+def _get_fetcher_setting(name, default):
+    """Get a fetcher.* setting from config, falling back to default."""
+    try:
+        from config import load_config
+        return getattr(load_config().fetcher, name)
+    except Exception:
+        return default
+
+
+# Strikes requested above and below ATM per chain; a smaller window means a
+# smaller response to transfer and decode for every ticker
+STRIKE_COUNT = _get_fetcher_setting('strike_count', 100)
+
+
+class RateLimiter:
+    """Thread-safe token bucket.
+
+    Allows bursts of up to `rate` requests and refills continuously at
+    `rate` per `period` seconds, so callers only wait once the budget is
+    spent instead of sleeping a fixed interval between every request.
+    """
+
+    def __init__(self, rate, period=60.0):
+        self.capacity = float(rate)
+        self.fill_rate = rate / period
+        self._tokens = float(rate)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.fill_rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.fill_rate
+            time.sleep(wait)
+
+
+# Shared by all fetch threads so the whole process stays within the quota
+_rate_limiter = RateLimiter(_get_fetcher_setting('max_requests_per_minute', 120))
+
+
+# Statuses that will not succeed on retry (bad request, expired token,
+# unknown/delisted symbol) — give up immediately instead of backing off
+TERMINAL_STATUS_CODES = (400, 401, 403, 404)
+MAX_RETRY_AFTER = 60  # cap on a server-supplied Retry-After, in seconds
+
+
+def _retry_delay(resp, base_delay, attempt):
+    """Backoff delay before the next attempt, honoring a Retry-After header."""
+    retry_after = resp.headers.get('Retry-After') if resp is not None else None
+    if retry_after:
+        try:
+            return min(max(0, int(retry_after)), MAX_RETRY_AFTER)
+        except ValueError:
+            pass  # HTTP-date form — fall back to exponential backoff
+    return base_delay * (2 ** (attempt - 1))
+
+
+# Cached client and the token.json mtime it was built from
+_client = None
+_client_token_mtime = None
+
+
 def get_client():
+    """Return a Schwab client, reusing the previous one while token.json is unchanged.
+
+    The client's HTTP session keeps connections alive, so reusing it across
+    fetch cycles avoids a fresh TCP+TLS handshake to api.schwabapi.com each
+    time. A rewritten token file (refresh or re-auth) gets a new client.
+    """
+    global _client, _client_token_mtime
+    try:
+        mtime = os.path.getmtime(TOKEN_PATH)
+    except OSError:
+        mtime = None
+
+    if _client is not None and mtime == _client_token_mtime:
+        return _client
+
     try:
         # Disable enum enforcement to allow string inputs like '$SPX' if needed
-        return schwab.auth.client_from_token_file(TOKEN_PATH, APP_KEY, APP_SECRET, enforce_enums=False)
+        _client = schwab.auth.client_from_token_file(TOKEN_PATH, APP_KEY, APP_SECRET, enforce_enums=False)
+        _client_token_mtime = mtime
+        return _client
     except Exception as e:
         log.error("Error initializing client: %s", e)
+        _client = None
         return None
 
 
+# CSV column order; keys of every row built by _iter_chain_rows
+FIELDNAMES = [
+    'Symbol', 'Underlying', 'UnderlyingPrice', 'OptionSymbol', 'Expiration', 'Strike', 'Type',
+    'Bid', 'Ask', 'Last', 'TradeSide', 'Volume', 'OpenInterest',
+    'Delta', 'Gamma', 'Theta', 'Vega', 'Rho', 'ImpliedVol'
+]
+
+
+def _iter_chain_rows(data, ticker, exp_map, option_type):
+    """Yield one flat contract row per option in a call/put expiration map."""
+    if not exp_map:
+        return
+
+    # Constant for the whole chain — resolve once, not per contract
+    display_ticker = ticker.lstrip('$')
+    underlying = data.get('symbol', ticker)
+    underlying_price = data.get('underlyingPrice', 0)
+
+    for strikes in exp_map.values():
+        for contracts in strikes.values():
+            # Schwab may return multiple contracts per strike
+            # (e.g. for $SPX: [SPX standard, SPXW weekly])
+            for contract in contracts:
+                bid = contract.get('bid', 0)
+                ask = contract.get('ask', 0)
+                last = contract.get('last', 0)
+
+                # Classify the last trade relative to the bid/ask spread
+                # (inline: this runs once per contract in the whole chain)
+                trade_side = 'MID'
+                if bid > 0 and ask > 0:
+                    if last >= ask:
+                        trade_side = 'ASK (Buy)'
+                    elif last <= bid:
+                        trade_side = 'BID (Sell)'
+                    else:
+                        mid_price = (bid + ask) / 2
+                        if last > mid_price:
+                            trade_side = 'Near ASK'
+                        elif last < mid_price:
+                            trade_side = 'Near BID'
+
+                row = {
+                    'Symbol': display_ticker,
+                    'Underlying': underlying,
+                    'UnderlyingPrice': underlying_price,
+                    'OptionSymbol': contract.get('symbol'),
+                    'Expiration': contract.get('expirationDate'),
+                    'Strike': contract.get('strikePrice'),
+                    'Type': option_type,
+                    'Bid': bid,
+                    'Ask': ask,
+                    'Last': last,
+                    'TradeSide': trade_side,
+                    'Volume': contract.get('totalVolume'),
+                    'OpenInterest': contract.get('openInterest'),
+                    'Delta': contract.get('delta'),
+                    'Gamma': contract.get('gamma'),
+                    'Theta': contract.get('theta'),
+                    'Vega': contract.get('vega'),
+                    'Rho': contract.get('rho'),
+                    'ImpliedVol': contract.get('volatility')
+                }
+                yield row
+
+
 def fetch_option_data(client, ticker):
     """Fetch option chain with exponential backoff retry.
 
     Handles index symbols ($SPX, $NDX, etc.) which may return
     multiple contracts per strike (e.g. SPX + SPXW).
+
+    Rate limits (429) and server errors are retried; client errors such as
+    an expired token (401) or unknown symbol (404) fail immediately.
     """
     max_attempts, base_delay = _get_retry_config()
 
@@ -74,17 +224,20 @@ def fetch_option_data(client, ticker):
         try:
             log.info("Fetching option chain for %s (attempt %d/%d)...", ticker, attempt, max_attempts)
 
+            _rate_limiter.acquire()
             resp = client.get_option_chain(
                 ticker,
                 contract_type=schwab.client.Client.Options.ContractType.ALL,
-                strike_count=100,
+                strike_count=STRIKE_COUNT,
                 include_underlying_quote=True
             )
 
             if resp.status_code != 200:
                 log.warning("  %s failed with status %d", ticker, resp.status_code)
+                if resp.status_code in TERMINAL_STATUS_CODES:
+                    return []
                 if attempt < max_attempts:
-                    delay = base_delay * (2 ** (attempt - 1))
+                    delay = _retry_delay(resp, base_delay, attempt)
                     log.info("  Retrying in %ds...", delay)
                     time.sleep(delay)
                     continue
@@ -95,58 +248,14 @@ def fetch_option_data(client, ticker):
                 log.warning("  %s API returned status: %s", ticker, data.get('status'))
                 return []
 
-            rows = []
-
-            # Helper to process map
-            def process_map(exp_map, option_type):
-                if not exp_map: return
-                for date_key, strikes in exp_map.items():
-                    for strike_price, contracts in strikes.items():
-                        # Schwab may return multiple contracts per strike
-                        # (e.g. for $SPX: [SPX standard, SPXW weekly])
-                        for contract in contracts:
-                            # Trade Side Logic
-                            bid = contract.get('bid', 0)
-                            ask = contract.get('ask', 0)
-                            last = contract.get('last', 0)
-
-                            trade_side = 'MID'
-                            if ask > 0 and bid > 0:
-                                mid_price = (bid + ask) / 2
-                                if last >= ask:
-                                    trade_side = 'ASK (Buy)'
-                                elif last <= bid:
-                                    trade_side = 'BID (Sell)'
-                                elif last > mid_price:
-                                    trade_side = 'Near ASK'
-                                elif last < mid_price:
-                                    trade_side = 'Near BID'
-
-                            row = {
-                                'Symbol': display_ticker,
-                                'Underlying': data.get('symbol', ticker),
-                                'UnderlyingPrice': data.get('underlyingPrice', 0),
-                                'OptionSymbol': contract.get('symbol'),
-                                'Expiration': contract.get('expirationDate'),
-                                'Strike': contract.get('strikePrice'),
-                                'Type': option_type,
-                                'Bid': bid,
-                                'Ask': ask,
-                                'Last': last,
-                                'TradeSide': trade_side,
-                                'Volume': contract.get('totalVolume'),
-                                'OpenInterest': contract.get('openInterest'),
-                                'Delta': contract.get('delta'),
-                                'Gamma': contract.get('gamma'),
-                                'Theta': contract.get('theta'),
-                                'Vega': contract.get('vega'),
-                                'Rho': contract.get('rho'),
-                                'ImpliedVol': contract.get('volatility')
-                            }
-                            rows.append(row)
-
-            process_map(data.get('callExpDateMap', {}), 'CALL')
-            process_map(data.get('putExpDateMap', {}), 'PUT')
+            # Release the raw response body before building rows so the encoded
+            # and decoded chain are not both held alongside the rows
+            del resp
+
+            # Pop each expiration map so its decoded tree is freed as soon as
+            # its rows are built, instead of living until the function returns
+            rows = list(_iter_chain_rows(data, ticker, data.pop('callExpDateMap', None), 'CALL'))
+            rows.extend(_iter_chain_rows(data, ticker, data.pop('putExpDateMap', None), 'PUT'))
 
             log.info("  %s: Retrieved %d contracts", display_ticker, len(rows))
             return rows
@@ -164,46 +273,58 @@ def fetch_option_data(client, ticker):
     return []
 
 
-def save_analytics_data(all_data):
-    """Generate analytics data (all_tickers_data.js) from options data"""
-    from datetime import datetime
-    timestamp = datetime.now().isoformat()
+# Per-strike aggregate fields, in accumulator order
+STRIKE_FIELDS = ('total_delta', 'total_gamma', 'total_theta', 'total_vega', 'oi', 'volume')
 
-    # Aggregate data by ticker and strike for analytics view
-    ticker_data = {}
+
+def aggregate_strikes(all_data):
+    """Sum OI-weighted Greeks, OI and volume per (ticker, strike).
+
+    Returns {ticker: {'price': underlying_price, 'strikes': {strike: {...}}}}
+    with per-strike dicts keyed by STRIKE_FIELDS, in first-seen order.
+    Missing values count as 0.
+    """
+    # Accumulate into flat lists keyed by (ticker, strike) in one pass; the
+    # nested ticker -> strikes -> field dicts are only built at the end.
+    prices = {}
+    sums = defaultdict(lambda: [0, 0, 0, 0, 0, 0])
 
     for contract in all_data:
-        ticker = contract['Symbol']
-        strike = contract['Strike']
-        underlying_price = contract['UnderlyingPrice']
-
-        if ticker not in ticker_data:
-            ticker_data[ticker] = {
-                'price': underlying_price,
-                'timestamp': timestamp,
-                'strikes': {}
-            }
-
-        if strike not in ticker_data[ticker]['strikes']:
-            ticker_data[ticker]['strikes'][strike] = {
-                'total_delta': 0,
-                'total_gamma': 0,
-                'total_theta': 0,
-                'total_vega': 0,
-                'oi': 0,
-                'volume': 0
-            }
+        ticker = contract.get('Symbol')
+        if not ticker:
+            continue
+
+        if ticker not in prices:
+            prices[ticker] = contract.get('UnderlyingPrice', 0)
+
+        acc = sums[ticker, contract.get('Strike', 0)]
 
         # Aggregate Greeks weighted by open interest
-        oi = contract.get('OpenInterest', 0)
-        volume = contract.get('Volume', 0)
+        oi = contract.get('OpenInterest') or 0
+
+        acc[0] += (contract.get('Delta') or 0) * oi
+        acc[1] += (contract.get('Gamma') or 0) * oi
+        acc[2] += (contract.get('Theta') or 0) * oi
+        acc[3] += (contract.get('Vega') or 0) * oi
+        acc[4] += oi
+        acc[5] += contract.get('Volume') or 0
 
-        ticker_data[ticker]['strikes'][strike]['total_delta'] += (contract.get('Delta', 0) * oi)
-        ticker_data[ticker]['strikes'][strike]['total_gamma'] += (contract.get('Gamma', 0) * oi)
-        ticker_data[ticker]['strikes'][strike]['total_theta'] += (contract.get('Theta', 0) * oi)
-        ticker_data[ticker]['strikes'][strike]['total_vega'] += (contract.get('Vega', 0) * oi)
-        ticker_data[ticker]['strikes'][strike]['oi'] += oi
-        ticker_data[ticker]['strikes'][strike]['volume'] += volume
+    result = {ticker: {'price': price, 'strikes': {}} for ticker, price in prices.items()}
+    for (ticker, strike), acc in sums.items():
+        result[ticker]['strikes'][strike] = dict(zip(STRIKE_FIELDS, acc))
+    return result
+
+
+def save_analytics_data(all_data):
+    """Generate analytics data (all_tickers_data.js) from options data"""
+    from datetime import datetime
+    timestamp = datetime.now().isoformat()
+
+    # Aggregate data by ticker and strike for analytics view
+    ticker_data = {
+        ticker: {'price': agg['price'], 'timestamp': timestamp, 'strikes': agg['strikes']}
+        for ticker, agg in aggregate_strikes(all_data).items()
+    }
 
     # Build output structure
     output = {
@@ -216,15 +337,17 @@ def save_analytics_data(all_data):
     }
 
     # Save as JavaScript file
-    js_content = f"// Auto-generated ticker data\n// Generated: {timestamp}\n// Total tickers: {len(ticker_data)}\n\n"
-    js_content += f"const TICKER_DATA = {json.dumps(output, indent=2)};\n"
+    header = f"// Auto-generated ticker data\n// Generated: {timestamp}\n// Total tickers: {len(ticker_data)}\n\n"
 
-    with open('all_tickers_data.js', 'w', encoding='utf-8') as f:
-        f.write(js_content)
+    with open('all_tickers_data.js', 'wb') as f:
+        f.write(header.encode('utf-8') + b"const TICKER_DATA = " + dumps(output, indent=True) + b";\n")
 
     log.info("Saved %d tickers to all_tickers_data.js", len(ticker_data))
 
 
+PARALLEL_WORKERS = _get_fetcher_setting('parallel_workers', 5)  # concurrent API calls (5 = safe for 1GB RAM servers)
+
+
 def _fetch_one(client, ticker):
     """Fetch a single ticker — used as a ThreadPoolExecutor target."""
     try:
@@ -235,74 +358,163 @@ def _fetch_one(client, ticker):
         return ticker, []
 
 
-PARALLEL_WORKERS = 5  # concurrent API calls (5 = safe for 1GB RAM servers)
-
-
-def main():
-    client = get_client()
-    if not client:
-        return
-
-    output_file = 'option_greeks_data.csv'
-    fieldnames = [
-        'Symbol', 'Underlying', 'UnderlyingPrice', 'OptionSymbol', 'Expiration', 'Strike', 'Type',
-        'Bid', 'Ask', 'Last', 'TradeSide', 'Volume', 'OpenInterest',
-        'Delta', 'Gamma', 'Theta', 'Vega', 'Rho', 'ImpliedVol'
-    ]
-
-    log.info("Starting parallel fetch for %d tickers (%d workers)...", len(TARGET_TICKERS), PARALLEL_WORKERS)
-    start_time = time.time()
+def fetch_tickers(client, tickers, parallel=True, workers=None, on_contracts=None):
+    """Fetch option chains for many tickers.
 
+    Returns (all_contracts, error_tickers). With parallel=False the tickers
+    are fetched one at a time on the calling thread. If given, on_contracts
+    is called on the calling thread with each ticker's contracts as soon as
+    they arrive, while the remaining fetches are still in flight; exceptions
+    it raises (e.g. a failed CSV write) cancel the fetches not yet started
+    and propagate to the caller.
+    """
     all_contracts = []
     errors = []
 
-    with ThreadPoolExecutor(max_workers=PARALLEL_WORKERS) as executor:
-        futures = {}
-        for i, ticker in enumerate(TARGET_TICKERS):
-            # Small stagger to avoid burst rate limiting
-            future = executor.submit(_fetch_one, client, ticker)
-            futures[future] = ticker
+    def _collect(ticker, contracts):
+        if contracts:
+            if on_contracts:
+                on_contracts(contracts)
+            all_contracts.extend(contracts)
+        else:
+            errors.append(ticker)
+
+    if not parallel:
+        for ticker in tickers:
+            _collect(*_fetch_one(client, ticker))
+        return all_contracts, errors
+
+    with ThreadPoolExecutor(max_workers=workers or PARALLEL_WORKERS) as executor:
+        futures = {executor.submit(_fetch_one, client, t): t for t in tickers}
 
         for future in as_completed(futures):
             ticker = futures[future]
             try:
-                _, contracts = future.result()
-                if contracts:
-                    all_contracts.extend(contracts)
-                else:
-                    errors.append(ticker)
+                result = future.result()
             except Exception as e:
                 log.error("Future error for %s: %s", ticker, e)
                 errors.append(ticker)
+                continue
+            try:
+                _collect(*result)
+            except BaseException:
+                # Don't let the executor's exit drain the queue — every
+                # pending fetch would still spend a rate-limited API call
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+    return all_contracts, errors
+
+
+OUTPUT_FORMATS = ('csv', 'parquet', 'both')
 
-    elapsed = time.time() - start_time
-    log.info("Fetched %d contracts from %d tickers in %.1fs (%d errors)",
-             len(all_contracts), len(TARGET_TICKERS) - len(errors), elapsed, len(errors))
 
-    # Save CSV
-    with open(output_file, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+def save_parquet(all_contracts, output_file='option_greeks_data.parquet'):
+    """Write contracts to a Snappy-compressed Parquet file (requires pyarrow).
+
+    Returns True if the file was written.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        log.warning("pyarrow not installed — skipping Parquet output")
+        return False
+
+    try:
+        pq.write_table(pa.Table.from_pylist(all_contracts), output_file, compression='snappy')
+    except Exception as e:
+        log.error("Parquet write failed: %s", e)
+        return False
+
+    log.info("Saved %d contracts to %s", len(all_contracts), output_file)
+    return True
+
+
+def main(output_format='csv', parallel=True, workers=PARALLEL_WORKERS):
+    """Fetch all target tickers and write the CSV/Parquet + dashboard files.
+
+    output_format: 'csv', 'parquet' or 'both'. Parquet output needs pyarrow;
+    if it cannot be written, the CSV is written instead.
+    parallel/workers: fetch with a thread pool of `workers`, or serially.
+    """
+    client = get_client()
+    if not client:
+        return
+
+    output_file = 'option_greeks_data.csv'
+
+    if parallel:
+        log.info("Starting parallel fetch for %d tickers (%d workers)...", len(TARGET_TICKERS), workers)
+    else:
+        log.info("Starting serial fetch for %d tickers...", len(TARGET_TICKERS))
+    start_time = time.time()
+
+    # Stream CSV rows to a temp file as each ticker completes, so disk writes
+    # overlap the fetches still in flight; it replaces the CSV only once complete
+    csv_stream = None
+    on_contracts = None
+    if output_format in ('csv', 'both'):
+        csv_stream = open(output_file + '.tmp', 'w', newline='')
+        writer = csv.DictWriter(csv_stream, fieldnames=FIELDNAMES)
         writer.writeheader()
-        writer.writerows(all_contracts)
+        on_contracts = writer.writerows
+
+    # Whatever happens before the replace, never leave the temp file behind
+    csv_replaced = False
+    try:
+        all_contracts, errors = fetch_tickers(client, TARGET_TICKERS, parallel=parallel,
+                                              workers=workers, on_contracts=on_contracts)
+
+        elapsed = time.time() - start_time
+        log.info("Fetched %d contracts from %d tickers in %.1fs (%d errors)",
+                 len(all_contracts), len(TARGET_TICKERS) - len(errors), elapsed, len(errors))
+
+        # Save Parquet and/or CSV
+        saved = []
+        if output_format in ('parquet', 'both'):
+            parquet_file = 'option_greeks_data.parquet'
+            if save_parquet(all_contracts, parquet_file):
+                saved.append(parquet_file)
+
+        if csv_stream:
+            csv_stream.close()
+            os.replace(csv_stream.name, output_file)
+            csv_replaced = True
+            saved.append(output_file)
+        elif not saved:
+            with open(output_file, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+                writer.writeheader()
+                writer.writerows(all_contracts)
+            saved.append(output_file)
+    finally:
+        if csv_stream and not csv_replaced:
+            csv_stream.close()
+            if os.path.exists(csv_stream.name):
+                os.remove(csv_stream.name)
 
     # Save JS file for dashboard
+    # Rows already hold the numeric values decoded from the API response,
+    # so the same list feeds the dashboard file and analytics directly
     log.info("Generating dashboard data file...")
-    for row in all_contracts:
-        for k, v in row.items():
-            if k not in ['Symbol', 'Underlying', 'OptionSymbol', 'Expiration', 'Type', 'TradeSide']:
-                try:
-                    row[k] = float(v) if v else 0
-                except:
-                    pass
-
-    with open('option_data.js', 'w', encoding='utf-8') as f:
-        f.write(f"const OPTION_DATA = {json.dumps(all_contracts)};")
+    with open('option_data.js', 'wb') as f:
+        f.write(b"const OPTION_DATA = " + dumps(all_contracts) + b";")
 
     # Also generate analytics data for analytics view
     save_analytics_data(all_contracts)
 
-    log.info("Done! Data saved to %s and option_data.js", output_file)
+    log.info("Done! Data saved to %s and option_data.js", ', '.join(saved))
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    parser = argparse.ArgumentParser(description="Fetch option chains from the Schwab API")
+    parser.add_argument('--format', dest='output_format', choices=OUTPUT_FORMATS, default='csv',
+                        help="contract output file format (parquet requires pyarrow)")
+    parser.add_argument('--serial', dest='parallel', action='store_false',
+                        help="fetch tickers one at a time instead of in parallel")
+    parser.add_argument('--workers', type=int, default=PARALLEL_WORKERS,
+                        help="concurrent API calls when fetching in parallel")
+    args = parser.parse_args()
+    main(output_format=args.output_format, parallel=args.parallel, workers=args.workers)
 
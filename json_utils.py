@@ -0,0 +1,50 @@
+"""
+JSON Serialization Helpers
+===========================
+Serializes and parses the large dashboard payloads (option_data.js,
+all_tickers_data.js, price_history.json) with orjson when it is installed,
+falling back to the stdlib json module.
+
+Usage:
+    from json_utils import dumps, loads
+    with open('data.js', 'wb') as f:
+        f.write(b"const DATA = " + dumps(data) + b";\n")
+    data = loads(text)
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
+
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON bytes.
+
+    Non-string dict keys (e.g. float strikes) are written as strings, as the
+    stdlib does. Unknown types fall back to str(). With orjson, NaN/Infinity
+    are written as null rather than the non-standard NaN literal.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option, default=str)
+    return json.dumps(obj, indent=2 if indent else None, default=str).encode('utf-8')
+
+
+def loads(data):
+    """Parse JSON from str or bytes.
+
+    Files written by older versions (via the stdlib) may contain NaN literals,
+    which orjson rejects; those are re-parsed with the stdlib json module.
+    Raises json.JSONDecodeError on invalid input with either backend.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
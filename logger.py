@@ -11,12 +11,43 @@ Usage:
 """
 
 import os
+import time
 import logging
 from logging.handlers import RotatingFileHandler
 
 
 _loggers = {}
 
+LOG_FORMAT = "[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders asctime at most once per wall-clock second.
+
+    The timestamp has second resolution, so every record logged within the
+    same second reuses the previously formatted string instead of calling
+    localtime() + strftime() again.
+    """
+
+    def __init__(self, fmt=LOG_FORMAT, datefmt=DATE_FORMAT):
+        super().__init__(fmt, datefmt=datefmt)
+        # (second, formatted text), swapped as one object so threads sharing
+        # this formatter never pair one second with another second's text
+        self._cache = (None, "")
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_second, cached_time = self._cache
+        if second != cached_second:
+            cached_time = time.strftime(datefmt or self.datefmt, self.converter(second))
+            self._cache = (second, cached_time)
+        return cached_time
+
+
+# One formatter shared by every handler get_logger() creates
+_formatter = _CachedTimeFormatter()
+
 
 def get_logger(name: str = "trading") -> logging.Logger:
     """Get or create a named logger with console + file handlers."""
@@ -46,15 +77,10 @@ def get_logger(name: str = "trading") -> logging.Logger:
 
     logger.setLevel(level)
 
-    formatter = logging.Formatter(
-        "[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-
     # Console handler
     console = logging.StreamHandler()
     console.setLevel(level)
-    console.setFormatter(formatter)
+    console.setFormatter(_formatter)
     logger.addHandler(console)
 
     # File handler with rotation
@@ -70,7 +96,7 @@ def get_logger(name: str = "trading") -> logging.Logger:
             encoding="utf-8"
         )
         file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(_formatter)
         logger.addHandler(file_handler)
     except Exception as e:
         logger.warning("Could not set up file logging: %s", e)
@@ -5,8 +5,8 @@ Runs continuous_fetcher.py only during market hours (configurable via config.yam
 
 import time
 import sys
-from datetime import datetime, time as dt_time
-import pytz
+from datetime import datetime, timedelta, time as dt_time
+from zoneinfo import ZoneInfo
 from continuous_fetcher import fetch_all_tickers
 from config import load_config
 from logger import get_logger
@@ -21,11 +21,12 @@ MARKET_OPEN = dt_time(int(_open_parts[0]), int(_open_parts[1]))
 MARKET_CLOSE = dt_time(int(_close_parts[0]), int(_close_parts[1]))
 REFRESH_INTERVAL = cfg.fetcher.refresh_interval
 TIMEZONE = cfg.market_hours.timezone
+_ET = ZoneInfo(TIMEZONE)  # resolved once; reused by every market-hours check
+MAX_WAIT_SECONDS = 3600  # longest single sleep while waiting for the open
 
 def is_market_hours():
     """Check if current time is during market hours"""
-    et = pytz.timezone(TIMEZONE)
-    now_et = datetime.now(et)
+    now_et = datetime.now(_ET)
 
     # Check if weekday (0=Monday, 6=Sunday)
     if now_et.weekday() >= 5:  # Saturday or Sunday
@@ -35,34 +36,38 @@ def is_market_hours():
     current_time = now_et.time()
     return MARKET_OPEN <= current_time <= MARKET_CLOSE
 
+def next_market_open(now_et):
+    """Return the next market open (ET) strictly after now_et, skipping weekends"""
+    day = now_et.date()
+    if now_et.time() >= MARKET_OPEN:
+        day += timedelta(days=1)
+    while day.weekday() >= 5:
+        day += timedelta(days=1)
+    return datetime.combine(day, MARKET_OPEN, tzinfo=_ET)
+
 def wait_for_market_open():
     """Wait until market opens"""
-    et = pytz.timezone(TIMEZONE)
-
     while not is_market_hours():
-        now_et = datetime.now(et)
-        current_time = now_et.time()
+        now_et = datetime.now(_ET)
+        next_open = next_market_open(now_et)
+        # Compare POSIX timestamps so a DST change before the open is accounted for
+        seconds_until_open = next_open.timestamp() - now_et.timestamp()
 
         if now_et.weekday() >= 5:
-            # Weekend - wait until Monday
             log.info("[%s] Weekend - Market closed", now_et.strftime('%Y-%m-%d %H:%M:%S %Z'))
-            time.sleep(3600)  # Check every hour
-        elif current_time < MARKET_OPEN:
-            # Before market open
-            minutes_until_open = ((datetime.combine(now_et.date(), MARKET_OPEN) -
-                                  datetime.combine(now_et.date(), current_time)).seconds // 60)
+        elif now_et.time() < MARKET_OPEN:
             log.info("[%s] Market opens in %d minutes",
-                     now_et.strftime('%Y-%m-%d %H:%M:%S %Z'), minutes_until_open)
-            time.sleep(60)  # Check every minute
+                     now_et.strftime('%Y-%m-%d %H:%M:%S %Z'), seconds_until_open // 60)
         else:
-            # After market close
             log.info("[%s] Market closed for today", now_et.strftime('%Y-%m-%d %H:%M:%S %Z'))
-            time.sleep(3600)  # Check every hour
+
+        # Wake at least hourly: time.sleep() does not advance while the host is
+        # suspended, so the wall clock is re-checked each pass
+        log.info("Next open %s", next_open.strftime('%Y-%m-%d %H:%M %Z'))
+        time.sleep(max(1, min(seconds_until_open, MAX_WAIT_SECONDS)))
 
 def run_during_market_hours():
     """Run continuous fetcher only during market hours"""
-    et = pytz.timezone(TIMEZONE)
-
     log.info("=" * 70)
     log.info("CONTINUOUS FETCHER - MARKET HOURS MODE")
     log.info("=" * 70)
@@ -74,7 +79,7 @@ def run_during_market_hours():
     try:
         while True:
             if is_market_hours():
-                now_et = datetime.now(et)
+                now_et = datetime.now(_ET)
                 log.info("[%s] Market is OPEN - Fetching data...",
                          now_et.strftime('%Y-%m-%d %H:%M:%S %Z'))
 
@@ -87,7 +92,7 @@ def run_during_market_hours():
                 # Wait for next interval
                 time.sleep(REFRESH_INTERVAL)
             else:
-                now_et = datetime.now(et)
+                now_et = datetime.now(_ET)
                 log.info("[%s] Market is CLOSED", now_et.strftime('%Y-%m-%d %H:%M:%S %Z'))
                 wait_for_market_open()
 
@@ -0,0 +1,37 @@
+"""
+Network Patches
+================
+Pins api.schwabapi.com to a fixed address to work around a system-specific
+getaddrinfo failure for that host. Importing this module installs the patch;
+repeated imports (or install() calls) leave a single patch in place.
+
+Usage:
+    import net_patches  # noqa: F401  (before any Schwab API call)
+"""
+
+import socket
+
+SCHWAB_HOST = 'api.schwabapi.com'
+SCHWAB_IP = '69.192.139.216'
+
+# Result for HTTPS (every call the Schwab client makes), built once
+_SCHWAB_ADDRINFO_HTTPS = [(socket.AF_INET, socket.SOCK_STREAM, 6, '', (SCHWAB_IP, 443))]
+
+_original_getaddrinfo = socket.getaddrinfo
+
+
+def patched_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    if host == SCHWAB_HOST:
+        if port == 443:
+            return _SCHWAB_ADDRINFO_HTTPS
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', (SCHWAB_IP, port))]
+    return _original_getaddrinfo(host, port, family, type, proto, flags)
+
+
+def install():
+    """Install the getaddrinfo patch (no-op if already installed)."""
+    if socket.getaddrinfo is not patched_getaddrinfo:
+        socket.getaddrinfo = patched_getaddrinfo
+
+
+install()
@@ -11,19 +11,12 @@ create a client from the token file.
 import os
 import sys
 import json
+import atexit
 from datetime import datetime
 from dotenv import load_dotenv
-import socket
 
-# --- DNS MONKEY PATCH ---
 # Fix for system-specific getaddrinfo failure on api.schwabapi.com
-original_getaddrinfo = socket.getaddrinfo
-def patched_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
-    if host == 'api.schwabapi.com':
-        return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('69.192.139.216', port))]
-    return original_getaddrinfo(host, port, family, type, proto, flags)
-socket.getaddrinfo = patched_getaddrinfo
-# ------------------------
+import net_patches  # noqa: F401
 
 import schwab
 
@@ -37,35 +30,57 @@ TOKEN_PATH = 'token.json'
 # Log file path
 LOG_FILE = 'token_refresh.log'
 
+# Log lines for the current run; written to LOG_FILE in one append by flush_log()
+_log_buffer = []
+
+# (mtime, info) of the last parsed token file
+_token_info_cache = (None, None)
+
 def log_message(message):
-    """Write message to log file with timestamp"""
+    """Print message with timestamp and buffer it for the log file"""
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     log_entry = f"[{timestamp}] {message}\n"
     
     # Print to console
     print(log_entry.strip())
     
-    # Append to log file
+    _log_buffer.append(log_entry)
+
+def flush_log():
+    """Append all buffered log lines to the log file with a single write"""
+    if not _log_buffer:
+        return
     try:
         with open(LOG_FILE, 'a', encoding='utf-8') as f:
-            f.write(log_entry)
+            f.write(''.join(_log_buffer))
     except Exception as e:
         print(f"Warning: Could not write to log file: {e}")
+    _log_buffer.clear()
+
+# Flush anything logged on an early-return path as well
+atexit.register(flush_log)
 
 def get_token_info():
-    """Read and display token information"""
+    """Read and display token information (re-parsed only when token.json changes)"""
+    global _token_info_cache
     try:
+        mtime = os.path.getmtime(TOKEN_PATH)
+        if _token_info_cache[0] == mtime:
+            return _token_info_cache[1]
+
         with open(TOKEN_PATH, 'r') as f:
             token_data = json.load(f)
         
         creation_time = datetime.fromtimestamp(token_data.get('creation_timestamp', 0))
         expires_in = token_data.get('token', {}).get('expires_in', 0)
         
-        return {
+        info = {
             'created': creation_time,
             'expires_in_seconds': expires_in,
             'expires_in_minutes': expires_in / 60
         }
+        _token_info_cache = (mtime, info)
+        return info
     except Exception as e:
         return None
 
@@ -128,6 +143,7 @@ def refresh_token():
     finally:
         log_message("=" * 60)
         log_message("")  # Empty line for readability
+        flush_log()
 
 if __name__ == "__main__":
     success = refresh_token()
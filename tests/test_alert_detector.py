@@ -5,11 +5,7 @@ Verifies GEX flip, max strike shift, and price-near-wall detection.
 """
 
 import pytest
-import sys
-import os
-
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from itertools import pairwise
 
 from alerts.detector import (
     detect_gex_flip,
@@ -21,58 +17,40 @@ from alerts.detector import (
 
 
 class TestGexFlipDetection:
-    def test_positive_to_negative_flip(self):
-        alert = detect_gex_flip('SPY', current_net_gex=-500000, previous_net_gex=300000)
+    @pytest.mark.parametrize("current,previous,severity,direction", [
+        pytest.param(-500000, 300000, 'critical', 'NEGATIVE', id='positive_to_negative'),
+        pytest.param(300000, -500000, 'warning', 'POSITIVE', id='negative_to_positive'),
+    ])
+    def test_flip(self, current, previous, severity, direction):
+        alert = detect_gex_flip('SPY', current_net_gex=current, previous_net_gex=previous)
         assert alert is not None
-        assert alert.severity == 'critical'
+        assert alert.severity == severity
         assert alert.alert_type == 'gex_flip'
-        assert 'NEGATIVE' in alert.message
-
-    def test_negative_to_positive_flip(self):
-        alert = detect_gex_flip('SPY', current_net_gex=300000, previous_net_gex=-500000)
-        assert alert is not None
-        assert alert.severity == 'warning'
-        assert 'POSITIVE' in alert.message
-
-    def test_no_flip_same_sign(self):
-        alert = detect_gex_flip('SPY', current_net_gex=100000, previous_net_gex=200000)
-        assert alert is None
+        assert direction in alert.message
 
-    def test_no_flip_both_negative(self):
-        alert = detect_gex_flip('SPY', current_net_gex=-100000, previous_net_gex=-200000)
-        assert alert is None
-
-    def test_none_previous_no_alert(self):
-        alert = detect_gex_flip('SPY', current_net_gex=100000, previous_net_gex=None)
-        assert alert is None
-
-    def test_none_current_no_alert(self):
-        alert = detect_gex_flip('SPY', current_net_gex=None, previous_net_gex=100000)
-        assert alert is None
+    @pytest.mark.parametrize("current,previous", [
+        pytest.param(100000, 200000, id='same_sign'),
+        pytest.param(-100000, -200000, id='both_negative'),
+        pytest.param(100000, None, id='none_previous'),
+        pytest.param(None, 100000, id='none_current'),
+    ])
+    def test_no_flip(self, current, previous):
+        assert detect_gex_flip('SPY', current_net_gex=current, previous_net_gex=previous) is None
 
 
 class TestMaxStrikeDetection:
-    def test_positive_strike_shift(self):
-        alerts = detect_new_max_strike('SPY', 595, 580, 590, 580)
-        assert len(alerts) == 1
-        assert 'Call wall shifted' in alerts[0].message
-
-    def test_negative_strike_shift(self):
-        alerts = detect_new_max_strike('SPY', 590, 575, 590, 580)
-        assert len(alerts) == 1
-        assert 'Put wall shifted' in alerts[0].message
-
-    def test_both_shifts(self):
-        alerts = detect_new_max_strike('SPY', 595, 575, 590, 580)
-        assert len(alerts) == 2
-
-    def test_no_shift(self):
-        alerts = detect_new_max_strike('SPY', 590, 580, 590, 580)
-        assert len(alerts) == 0
-
-    def test_none_values_no_alert(self):
-        alerts = detect_new_max_strike('SPY', None, None, None, None)
-        assert len(alerts) == 0
+    @pytest.mark.parametrize("strikes,expected", [
+        pytest.param((595, 580, 590, 580), ['Call wall shifted'], id='positive_shift'),
+        pytest.param((590, 575, 590, 580), ['Put wall shifted'], id='negative_shift'),
+        pytest.param((595, 575, 590, 580), ['Call wall shifted', 'Put wall shifted'], id='both_shifts'),
+        pytest.param((590, 580, 590, 580), [], id='no_shift'),
+        pytest.param((None, None, None, None), [], id='none_values'),
+    ])
+    def test_strike_shift(self, strikes, expected):
+        alerts = detect_new_max_strike('SPY', *strikes)
+        assert len(alerts) == len(expected)
+        for alert, text in zip(alerts, expected):
+            assert text in alert.message
 
 
 class TestPriceNearWall:
@@ -121,7 +99,6 @@ class TestRunAllChecks:
                             'max_positive_gamma_value': 100, 'max_negative_gamma_value': -500}}
         alerts = run_all_checks(current, previous, threshold_pct=1.0)
         # Should be sorted: critical first
-        if len(alerts) > 1:
-            sev = {'critical': 0, 'warning': 1, 'info': 2}
-            for i in range(len(alerts) - 1):
-                assert sev[alerts[i].severity] <= sev[alerts[i+1].severity]
+        sev = {'critical': 0, 'warning': 1, 'info': 2}
+        ranks = [sev[a.severity] for a in alerts]
+        assert all(a <= b for a, b in pairwise(ranks)), ranks
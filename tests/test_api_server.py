@@ -5,52 +5,72 @@ Uses FastAPI TestClient to verify REST endpoints.
 """
 
 import pytest
-import sys
-import os
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from types import MappingProxyType
 
 from fastapi.testclient import TestClient
+
+import api_server
+import db.models
 from api_server import app, _data_store
 
 
+# Seed data, built once at import. Only the top level of each prototype is
+# read-only (tuple / MappingProxyType); the inner dicts are ordinary mutable
+# dicts shared by every test. Each test gets fresh top-level containers, so
+# tests may replace entries in _data_store but must not mutate nested values.
+_SEED_OPTION_DATA = (
+    {'Symbol': 'SPY', 'Strike': 590, 'Type': 'CALL', 'OpenInterest': 10000,
+     'Gamma': 0.02, 'Delta': 0.5, 'UnderlyingPrice': 590},
+    {'Symbol': 'SPY', 'Strike': 590, 'Type': 'PUT', 'OpenInterest': 8000,
+     'Gamma': 0.018, 'Delta': -0.5, 'UnderlyingPrice': 590},
+    {'Symbol': 'QQQ', 'Strike': 500, 'Type': 'CALL', 'OpenInterest': 5000,
+     'Gamma': 0.015, 'Delta': 0.45, 'UnderlyingPrice': 500},
+)
+_SEED_ANALYTICS = MappingProxyType({
+    'data': {
+        'SPY': {'price': 590, 'strikes': {590: {'total_gamma': 0.02, 'oi': 18000}}},
+        'QQQ': {'price': 500, 'strikes': {500: {'total_gamma': 0.015, 'oi': 5000}}},
+    },
+    'metadata': {'total_tickers': 2}
+})
+_SEED_GAMMA = MappingProxyType({
+    'SPY': {'max_positive_gamma_strike': 595, 'max_negative_gamma_strike': 580}
+})
+
+
 @pytest.fixture(autouse=True)
 def setup_test_data():
     """Seed the in-memory store with test data."""
-    _data_store['option_data'] = [
-        {'Symbol': 'SPY', 'Strike': 590, 'Type': 'CALL', 'OpenInterest': 10000,
-         'Gamma': 0.02, 'Delta': 0.5, 'UnderlyingPrice': 590},
-        {'Symbol': 'SPY', 'Strike': 590, 'Type': 'PUT', 'OpenInterest': 8000,
-         'Gamma': 0.018, 'Delta': -0.5, 'UnderlyingPrice': 590},
-        {'Symbol': 'QQQ', 'Strike': 500, 'Type': 'CALL', 'OpenInterest': 5000,
-         'Gamma': 0.015, 'Delta': 0.45, 'UnderlyingPrice': 500},
-    ]
-    _data_store['analytics_data'] = {
-        'data': {
-            'SPY': {'price': 590, 'strikes': {590: {'total_gamma': 0.02, 'oi': 18000}}},
-            'QQQ': {'price': 500, 'strikes': {500: {'total_gamma': 0.015, 'oi': 5000}}},
-        },
-        'metadata': {'total_tickers': 2}
-    }
-    _data_store['gamma_levels'] = {
-        'SPY': {'max_positive_gamma_strike': 595, 'max_negative_gamma_strike': 580}
-    }
+    _data_store['option_data'] = list(_SEED_OPTION_DATA)
+    _data_store['analytics_data'] = dict(_SEED_ANALYTICS)
+    _data_store['gamma_levels'] = dict(_SEED_GAMMA)
     _data_store['last_updated'] = '2026-02-15T10:00:00'
     yield
 
 
-client = TestClient(app)
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient (and one app startup) shared by every API test.
+
+    The lifespan's DB init and file reload are stubbed out so the suite never
+    touches data/options_history.db or the dashboard files in the repo.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(db.models, 'init_db', lambda *args, **kwargs: None)
+        mp.setattr(api_server, 'refresh_data_store', lambda: None)
+        with TestClient(app) as c:
+            yield c
 
 
 class TestHealthEndpoint:
-    def test_health_returns_ok(self):
+    def test_health_returns_ok(self, client):
         resp = client.get('/api/health')
         assert resp.status_code == 200
         data = resp.json()
         assert data['status'] == 'ok'
         assert 'last_updated' in data
 
-    def test_health_has_counts(self):
+    def test_health_has_counts(self, client):
         resp = client.get('/api/health')
         data = resp.json()
         assert data['contracts'] == 3
@@ -58,7 +78,7 @@ class TestHealthEndpoint:
 
 
 class TestTickersEndpoint:
-    def test_list_tickers(self):
+    def test_list_tickers(self, client):
         resp = client.get('/api/tickers')
         assert resp.status_code == 200
         tickers = resp.json()['tickers']
@@ -67,39 +87,53 @@ class TestTickersEndpoint:
 
 
 class TestOptionsEndpoint:
-    def test_get_spy_options(self):
+    def test_get_spy_options(self, client):
         resp = client.get('/api/options/SPY')
         assert resp.status_code == 200
         data = resp.json()
         assert data['ticker'] == 'SPY'
         assert data['count'] == 2
 
-    def test_unknown_ticker_404(self):
+    def test_unknown_ticker_404(self, client):
         resp = client.get('/api/options/ZZZZZ')
         assert resp.status_code == 404
 
+    def test_reflects_replaced_option_data(self, client):
+        assert client.get('/api/options/SPY').json()['count'] == 2
+        _data_store['option_data'] = [dict(_SEED_OPTION_DATA[0])]
+        assert client.get('/api/options/SPY').json()['count'] == 1
+        assert client.get('/api/options/QQQ').status_code == 404
+
+    def test_nan_greek_serialized_as_null(self, client):
+        _data_store['option_data'] = [
+            {'Symbol': 'IWM', 'Strike': 220, 'Type': 'CALL', 'Gamma': float('nan')}]
+        resp = client.get('/api/options/IWM')
+        assert resp.status_code == 200
+        assert resp.headers['content-type'] == 'application/json'
+        assert resp.json()['contracts'][0]['Gamma'] is None
+
 
 class TestAnalyticsEndpoint:
-    def test_get_spy_analytics(self):
+    def test_get_spy_analytics(self, client):
         resp = client.get('/api/analytics/SPY')
         assert resp.status_code == 200
         data = resp.json()
         assert data['ticker'] == 'SPY'
         assert 'data' in data
 
-    def test_unknown_ticker_404(self):
+    def test_unknown_ticker_404(self, client):
         resp = client.get('/api/analytics/ZZZZZ')
         assert resp.status_code == 404
 
 
 class TestGammaLevelsEndpoint:
-    def test_all_gamma_levels(self):
+    def test_all_gamma_levels(self, client):
         resp = client.get('/api/gamma-levels')
         assert resp.status_code == 200
         data = resp.json()
         assert 'SPY' in data
 
-    def test_spy_gamma_levels(self):
+    def test_spy_gamma_levels(self, client):
         resp = client.get('/api/gamma-levels/SPY')
         assert resp.status_code == 200
         data = resp.json()
@@ -107,7 +141,7 @@ class TestGammaLevelsEndpoint:
 
 
 class TestCorsHeaders:
-    def test_cors_present(self):
+    def test_cors_present(self, client):
         resp = client.options('/api/health', headers={
             'Origin': 'http://localhost:3000',
             'Access-Control-Request-Method': 'GET'
@@ -116,7 +150,18 @@ class TestCorsHeaders:
         assert resp.status_code == 200
 
 
+class TestLifespan:
+    def test_startup_inits_db_and_loads_data_once(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(db.models, 'init_db', lambda *args, **kwargs: calls.append('init_db'))
+        monkeypatch.setattr(api_server, 'refresh_data_store', lambda: calls.append('refresh'))
+        with TestClient(app) as c:
+            c.get('/api/health')
+            c.get('/api/health')
+        assert calls == ['init_db', 'refresh']
+
+
 class TestMetadataEndpoint:
-    def test_metadata(self):
+    def test_metadata(self, client):
         resp = client.get('/api/metadata')
         assert resp.status_code == 200
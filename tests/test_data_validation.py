@@ -5,47 +5,49 @@ Validates that option contract data has correct structure and reasonable values.
 """
 
 import pytest
+from operator import itemgetter
+
+
+_BASE_CONTRACT = {
+    'Symbol': 'SPY',
+    'Underlying': 'SPY',
+    'UnderlyingPrice': 590.0,
+    'OptionSymbol': 'SPY250321C00590000',
+    'Expiration': '2025-03-21',
+    'Strike': 590.0,
+    'Type': 'CALL',
+    'Bid': 5.10,
+    'Ask': 5.20,
+    'Last': 5.15,
+    'TradeSide': 'MID',
+    'Volume': 1500,
+    'OpenInterest': 25000,
+    'Delta': 0.5,
+    'Gamma': 0.02,
+    'Theta': -0.05,
+    'Vega': 0.15,
+    'Rho': 0.01,
+    'ImpliedVol': 18.5,
+}
 
 
 def make_contract(**overrides):
     """Create a valid test contract dict."""
-    base = {
-        'Symbol': 'SPY',
-        'Underlying': 'SPY',
-        'UnderlyingPrice': 590.0,
-        'OptionSymbol': 'SPY250321C00590000',
-        'Expiration': '2025-03-21',
-        'Strike': 590.0,
-        'Type': 'CALL',
-        'Bid': 5.10,
-        'Ask': 5.20,
-        'Last': 5.15,
-        'TradeSide': 'MID',
-        'Volume': 1500,
-        'OpenInterest': 25000,
-        'Delta': 0.5,
-        'Gamma': 0.02,
-        'Theta': -0.05,
-        'Vega': 0.15,
-        'Rho': 0.01,
-        'ImpliedVol': 18.5,
-    }
-    base.update(overrides)
-    return base
+    return _BASE_CONTRACT | overrides
 
 
 # --- Required Fields Tests ---
 
-REQUIRED_FIELDS = [
+REQUIRED_FIELDS = frozenset({
     'Symbol', 'Strike', 'Type', 'OpenInterest', 'Gamma', 'Delta',
     'Vega', 'Theta', 'UnderlyingPrice'
-]
+})
 
 class TestRequiredFields:
     def test_valid_contract_has_all_fields(self):
         c = make_contract()
-        for field in REQUIRED_FIELDS:
-            assert field in c, f"Missing required field: {field}"
+        missing = REQUIRED_FIELDS - c.keys()
+        assert not missing, f"Missing required fields: {sorted(missing)}"
 
     def test_missing_field_detected(self):
         c = make_contract()
@@ -56,40 +58,23 @@ class TestRequiredFields:
 # --- Numeric Validation Tests ---
 
 class TestNumericValidation:
-    def test_strike_is_positive(self):
+    @pytest.mark.parametrize("field,is_valid", [
+        ('Strike', lambda v: v > 0),
+        ('OpenInterest', lambda v: v >= 0),
+        ('Volume', lambda v: v >= 0),
+        ('UnderlyingPrice', lambda v: v > 0),
+        ('Delta', lambda v: -1 <= v <= 1),      # Delta should be between -1 and 1
+        ('Gamma', lambda v: v >= 0),            # Gamma is always non-negative
+        ('ImpliedVol', lambda v: v > 0),
+    ])
+    def test_valid_range(self, field, is_valid):
         c = make_contract()
-        assert c['Strike'] > 0
+        assert is_valid(c[field])
 
     def test_strike_zero_invalid(self):
         c = make_contract(Strike=0)
         assert c['Strike'] <= 0  # Should fail validation
 
-    def test_oi_non_negative(self):
-        c = make_contract()
-        assert c['OpenInterest'] >= 0
-
-    def test_volume_non_negative(self):
-        c = make_contract()
-        assert c['Volume'] >= 0
-
-    def test_underlying_price_positive(self):
-        c = make_contract()
-        assert c['UnderlyingPrice'] > 0
-
-    def test_delta_in_range(self):
-        """Delta should be between -1 and 1."""
-        c = make_contract()
-        assert -1 <= c['Delta'] <= 1
-
-    def test_gamma_non_negative(self):
-        """Gamma is always non-negative."""
-        c = make_contract()
-        assert c['Gamma'] >= 0
-
-    def test_implied_vol_positive(self):
-        c = make_contract()
-        assert c['ImpliedVol'] > 0
-
 
 # --- Option Type Tests ---
 
@@ -132,19 +117,31 @@ class TestTradeSide:
 
 # --- Batch Validation ---
 
+get_symbol = itemgetter('Symbol')
+get_strike = itemgetter('Strike')
+
+
+@pytest.fixture(scope="class")
+def same_ticker_batch():
+    return [make_contract(Symbol='SPY') for _ in range(10)]
+
+
+@pytest.fixture(scope="class")
+def multi_ticker_batch():
+    return [
+        make_contract(Symbol='SPY'),
+        make_contract(Symbol='QQQ'),
+        make_contract(Symbol='AAPL'),
+    ]
+
+
 class TestBatchValidation:
-    def test_batch_all_same_ticker(self):
-        contracts = [make_contract(Symbol='SPY') for _ in range(10)]
-        tickers = set(c['Symbol'] for c in contracts)
+    def test_batch_all_same_ticker(self, same_ticker_batch):
+        tickers = set(map(get_symbol, same_ticker_batch))
         assert len(tickers) == 1
 
-    def test_batch_multiple_tickers(self):
-        contracts = [
-            make_contract(Symbol='SPY'),
-            make_contract(Symbol='QQQ'),
-            make_contract(Symbol='AAPL'),
-        ]
-        tickers = set(c['Symbol'] for c in contracts)
+    def test_batch_multiple_tickers(self, multi_ticker_batch):
+        tickers = set(map(get_symbol, multi_ticker_batch))
         assert len(tickers) == 3
 
     def test_batch_strike_ordering(self):
@@ -153,5 +150,5 @@ class TestBatchValidation:
             make_contract(Strike=590),
             make_contract(Strike=600),
         ]
-        strikes = [c['Strike'] for c in contracts]
+        strikes = list(map(get_strike, contracts))
         assert strikes == sorted(strikes)
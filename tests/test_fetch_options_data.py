@@ -0,0 +1,292 @@
+"""
+Tests for Option Chain Fetching
+================================
+Verifies retry behavior, row building and client reuse against a fake Schwab client.
+"""
+
+import pytest
+import copy
+import os
+import time
+
+import fetch_options_data
+from fetch_options_data import fetch_option_data
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None, headers=None):
+        self.status_code = status_code
+        self._payload = payload or {}
+        self.headers = headers or {}
+        self.text = ''
+
+    def json(self):
+        # Like a real response, decode a fresh object on every call
+        return copy.deepcopy(self._payload)
+
+
+class FakeClient:
+    """Returns queued responses from get_option_chain, one per call."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def get_option_chain(self, ticker, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+SUCCESS = FakeResponse(200, {
+    'status': 'SUCCESS',
+    'symbol': 'SPY',
+    'underlyingPrice': 590.0,
+    'callExpDateMap': {'2026-03-20:30': {'590.0': [{
+        'symbol': 'SPY_C590', 'expirationDate': '2026-03-20', 'strikePrice': 590.0,
+        'bid': 5.0, 'ask': 5.2, 'last': 5.3, 'totalVolume': 100, 'openInterest': 1000,
+        'delta': 0.5, 'gamma': 0.02, 'theta': -0.05, 'vega': 0.15, 'rho': 0.01,
+        'volatility': 18.5,
+    }]}},
+    'putExpDateMap': {},
+})
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff sleeps instead of actually sleeping."""
+    recorded = []
+    monkeypatch.setattr(fetch_options_data.time, 'sleep', recorded.append)
+    # A bucket of its own that never runs dry, so refill waits can't leak into
+    # `recorded` once the suite spends the shared limiter's tokens
+    monkeypatch.setattr(fetch_options_data, '_rate_limiter', fetch_options_data.RateLimiter(10**6))
+    monkeypatch.setattr(fetch_options_data, '_get_retry_config', lambda: (3, 2))
+    return recorded
+
+
+class TestRetryBehavior:
+    def test_success_first_try(self, sleeps):
+        client = FakeClient(SUCCESS)
+        rows = fetch_option_data(client, 'SPY')
+        assert len(rows) == 1
+        assert rows[0]['TradeSide'] == 'ASK (Buy)'
+        assert sleeps == []
+
+    @pytest.mark.parametrize("status", [400, 401, 403, 404])
+    def test_terminal_status_no_retry(self, sleeps, status):
+        client = FakeClient(FakeResponse(status))
+        assert fetch_option_data(client, 'SPY') == []
+        assert client.calls == 1
+        assert sleeps == []
+
+    def test_server_error_backs_off_then_succeeds(self, sleeps):
+        client = FakeClient(FakeResponse(503), FakeResponse(502), SUCCESS)
+        rows = fetch_option_data(client, 'SPY')
+        assert len(rows) == 1
+        assert sleeps == [2, 4]
+
+    def test_retry_after_header_honored(self, sleeps):
+        client = FakeClient(FakeResponse(429, headers={'Retry-After': '7'}), SUCCESS)
+        fetch_option_data(client, 'SPY')
+        assert sleeps == [7]
+
+    def test_retry_after_capped(self, sleeps):
+        client = FakeClient(FakeResponse(429, headers={'Retry-After': '3600'}), SUCCESS)
+        fetch_option_data(client, 'SPY')
+        assert sleeps == [fetch_options_data.MAX_RETRY_AFTER]
+
+    def test_gives_up_after_max_attempts(self, sleeps):
+        client = FakeClient(FakeResponse(500), FakeResponse(500), FakeResponse(500))
+        assert fetch_option_data(client, 'SPY') == []
+        assert client.calls == 3
+
+
+class TestChainRows:
+    def test_calls_puts_and_multiple_contracts_per_strike(self, sleeps):
+        contract = SUCCESS.json()['callExpDateMap']['2026-03-20:30']['590.0'][0]
+        payload = dict(SUCCESS.json(), symbol='$SPX',
+                       callExpDateMap={'2026-03-20:30': {'590.0': [contract, contract]}},
+                       putExpDateMap={'2026-03-20:30': {'590.0': [contract]}})
+        rows = fetch_option_data(FakeClient(FakeResponse(200, payload)), '$SPX')
+        assert [r['Type'] for r in rows] == ['CALL', 'CALL', 'PUT']
+        assert all(r['Symbol'] == 'SPX' and r['Underlying'] == '$SPX' for r in rows)
+
+    def test_missing_put_map(self, sleeps):
+        payload = dict(SUCCESS.json(), putExpDateMap=None)
+        rows = fetch_option_data(FakeClient(FakeResponse(200, payload)), 'SPY')
+        assert len(rows) == 1
+
+    def test_row_keys_match_csv_columns(self, sleeps):
+        rows = fetch_option_data(FakeClient(SUCCESS), 'SPY')
+        assert list(rows[0]) == fetch_options_data.FIELDNAMES
+
+
+class TestClassifyTradeSide:
+    @pytest.mark.parametrize("bid,ask,last,expected", [
+        (5.0, 5.5, 5.6, 'ASK (Buy)'),
+        (5.0, 5.5, 5.5, 'ASK (Buy)'),
+        (5.0, 5.5, 4.9, 'BID (Sell)'),
+        (5.0, 5.5, 5.4, 'Near ASK'),
+        (5.0, 5.5, 5.1, 'Near BID'),
+        (5.0, 5.5, 5.25, 'MID'),
+        (0, 5.5, 5.6, 'MID'),
+        (5.0, 0, 4.0, 'MID'),
+    ])
+    def test_classification(self, sleeps, bid, ask, last, expected):
+        payload = SUCCESS.json()
+        contract = payload['callExpDateMap']['2026-03-20:30']['590.0'][0]
+        contract.update(bid=bid, ask=ask, last=last)
+        rows = fetch_option_data(FakeClient(FakeResponse(200, payload)), 'SPY')
+        assert rows[0]['TradeSide'] == expected
+
+
+class TickerClient:
+    """Succeeds for SPY, returns 404 for anything else."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_option_chain(self, ticker, **kwargs):
+        self.calls += 1
+        return SUCCESS if ticker == 'SPY' else FakeResponse(404)
+
+
+class TestFetchTickers:
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_collects_contracts_and_errors(self, sleeps, parallel):
+        contracts, errors = fetch_options_data.fetch_tickers(
+            TickerClient(), ['SPY', 'ZZZZ', 'SPY'], parallel=parallel, workers=2)
+        assert len(contracts) == 2
+        assert errors == ['ZZZZ']
+
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_on_contracts_called_per_successful_ticker(self, sleeps, parallel):
+        batches = []
+        contracts, _ = fetch_options_data.fetch_tickers(
+            TickerClient(), ['SPY', 'ZZZZ', 'SPY'], parallel=parallel, workers=2,
+            on_contracts=batches.append)
+        assert [row for batch in batches for row in batch] == contracts
+        assert len(batches) == 2
+
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_on_contracts_error_propagates(self, sleeps, parallel):
+        def failing_write(rows):
+            raise OSError("disk full")
+        with pytest.raises(OSError):
+            fetch_options_data.fetch_tickers(
+                TickerClient(), ['SPY', 'SPY'], parallel=parallel, workers=2,
+                on_contracts=failing_write)
+
+    def test_on_contracts_error_cancels_pending_fetches(self, sleeps):
+        def failing_write(rows):
+            raise OSError("disk full")
+        client = TickerClient()
+        tickers = ['SPY'] * 40
+        with pytest.raises(OSError):
+            fetch_options_data.fetch_tickers(
+                client, tickers, parallel=True, workers=2, on_contracts=failing_write)
+        assert client.calls < len(tickers)
+
+
+class TestMainCsvOutput:
+    @pytest.fixture
+    def run_dir(self, tmp_path, monkeypatch, sleeps):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(fetch_options_data, 'get_client', TickerClient)
+        monkeypatch.setattr(fetch_options_data, 'TARGET_TICKERS', ['SPY', 'ZZZZ'])
+        return tmp_path
+
+    def test_csv_written_and_temp_file_replaced(self, run_dir):
+        fetch_options_data.main(parallel=False)
+        lines = (run_dir / 'option_greeks_data.csv').read_text().splitlines()
+        assert lines[0].split(',') == fetch_options_data.FIELDNAMES
+        assert len(lines) == 2
+        assert not (run_dir / 'option_greeks_data.csv.tmp').exists()
+
+    def test_failed_fetch_keeps_previous_csv(self, run_dir, monkeypatch):
+        (run_dir / 'option_greeks_data.csv').write_text('previous')
+
+        def boom(*args, **kwargs):
+            raise KeyboardInterrupt
+        monkeypatch.setattr(fetch_options_data, 'fetch_tickers', boom)
+
+        with pytest.raises(KeyboardInterrupt):
+            fetch_options_data.main(parallel=False)
+        assert (run_dir / 'option_greeks_data.csv').read_text() == 'previous'
+        assert not (run_dir / 'option_greeks_data.csv.tmp').exists()
+
+    def test_failed_save_removes_temp_file(self, run_dir, monkeypatch):
+        (run_dir / 'option_greeks_data.csv').write_text('previous')
+
+        def boom(*args, **kwargs):
+            raise OSError("parquet write failed")
+        monkeypatch.setattr(fetch_options_data, 'save_parquet', boom)
+
+        with pytest.raises(OSError):
+            fetch_options_data.main(output_format='both', parallel=False)
+        assert (run_dir / 'option_greeks_data.csv').read_text() == 'previous'
+        assert not (run_dir / 'option_greeks_data.csv.tmp').exists()
+
+
+class TestGetClient:
+    @pytest.fixture
+    def token_file(self, tmp_path, monkeypatch):
+        path = tmp_path / 'token.json'
+        path.write_text('{}')
+        created = []
+        monkeypatch.setattr(fetch_options_data, 'TOKEN_PATH', str(path))
+        monkeypatch.setattr(fetch_options_data, '_client', None)
+        monkeypatch.setattr(fetch_options_data.schwab.auth, 'client_from_token_file',
+                            lambda *a, **kw: created.append(object()) or created[-1])
+        return path, created
+
+    def test_reuses_client(self, token_file):
+        _, created = token_file
+        assert fetch_options_data.get_client() is fetch_options_data.get_client()
+        assert len(created) == 1
+
+    def test_new_client_when_token_rewritten(self, token_file):
+        path, created = token_file
+        first = fetch_options_data.get_client()
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+        assert fetch_options_data.get_client() is not first
+        assert len(created) == 2
+
+
+class TestRateLimiter:
+    def test_burst_within_budget_does_not_wait(self):
+        limiter = fetch_options_data.RateLimiter(5, period=60)
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.acquire()
+        assert time.monotonic() - start < 0.05
+
+    def test_waits_once_budget_spent(self):
+        limiter = fetch_options_data.RateLimiter(2, period=0.2)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.acquire()
+        assert time.monotonic() - start >= 0.09
+
+
+class TestAggregateStrikes:
+    def test_sums_oi_weighted_greeks_per_strike(self):
+        contracts = [
+            {'Symbol': 'SPY', 'Strike': 590, 'UnderlyingPrice': 590, 'OpenInterest': 100,
+             'Delta': 0.5, 'Gamma': 0.02, 'Theta': -0.1, 'Vega': 0.2, 'Volume': 10},
+            {'Symbol': 'SPY', 'Strike': 590, 'UnderlyingPrice': 590, 'OpenInterest': 50,
+             'Delta': -0.4, 'Gamma': 0.02, 'Theta': -0.1, 'Vega': 0.2, 'Volume': 5},
+            {'Symbol': 'SPY', 'Strike': 600, 'UnderlyingPrice': 590, 'OpenInterest': None,
+             'Delta': None, 'Gamma': 0.01, 'Theta': None, 'Vega': None, 'Volume': None},
+        ]
+        result = fetch_options_data.aggregate_strikes(contracts)
+        assert result['SPY']['price'] == 590
+        s = result['SPY']['strikes'][590]
+        assert s['total_delta'] == pytest.approx(100 * 0.5 - 50 * 0.4)
+        assert s['total_gamma'] == pytest.approx(150 * 0.02)
+        assert s['oi'] == 150
+        assert s['volume'] == 15
+        assert result['SPY']['strikes'][600] == dict.fromkeys(fetch_options_data.STRIKE_FIELDS, 0)
+
+    def test_skips_contracts_without_symbol(self):
+        assert fetch_options_data.aggregate_strikes([{'Strike': 590}]) == {}
@@ -5,20 +5,19 @@ Verifies Gamma Exposure formulas and star level computation against known values
 """
 
 import pytest
+from collections import defaultdict
+
+
+_SIGN_TABLE = {'CALL': 1.0, 'PUT': -1.0}
 
 
 def compute_gex(gamma, oi, spot_price, option_type):
     """Compute GEX for a single contract (matches extract_gamma_levels.py logic).
     
-    Formula: Gamma × OI × 100 × SpotPrice² × 0.01
+    Formula: Gamma × OI × 100 × SpotPrice² × 0.01 (the 100 × 0.01 cancels)
     Calls contribute positive GEX, puts contribute negative GEX.
     """
-    exposure = gamma * oi * 100 * spot_price * spot_price * 0.01
-    if option_type == 'CALL':
-        return exposure
-    elif option_type == 'PUT':
-        return -exposure
-    return 0
+    return _SIGN_TABLE.get(option_type, 0.0) * gamma * oi * (spot_price * spot_price)
 
 
 def compute_net_gex_simple(gamma, oi, spot_price, option_type):
@@ -29,6 +28,14 @@ def compute_net_gex_simple(gamma, oi, spot_price, option_type):
     return gex
 
 
+def aggregate_gex_by_strike(contracts):
+    """Sum net GEX per strike: {strike: net GEX}."""
+    cell_gex = defaultdict(float)
+    for c in contracts:
+        cell_gex[c['strike']] += compute_gex(c['gamma'], c['oi'], c['spot'], c['type'])
+    return cell_gex
+
+
 class TestGexFormula:
     """Test the GEX formula with known inputs."""
 
@@ -85,28 +92,26 @@ class TestStarLevelComputation:
 
     def _find_star_levels(self, contracts):
         """Simplified version of compute_star_levels."""
-        cell_gex = {}  # strike -> net GEX
-
-        for c in contracts:
-            strike = c['strike']
-            gex = compute_gex(c['gamma'], c['oi'], c['spot'], c['type'])
-            cell_gex[strike] = cell_gex.get(strike, 0) + gex
-
-        max_pos_strike = None
-        max_pos_gex = -float('inf')
-        max_neg_strike = None
-        max_neg_gex = float('inf')
-
-        for strike, gex in cell_gex.items():
-            if gex > 0 and gex > max_pos_gex:
-                max_pos_gex = gex
-                max_pos_strike = strike
-            if gex < 0 and gex < max_neg_gex:
-                max_neg_gex = gex
-                max_neg_strike = strike
+        cell_gex = aggregate_gex_by_strike(contracts)
+
+        positive = [(gex, strike) for strike, gex in cell_gex.items() if gex > 0]
+        negative = [(gex, strike) for strike, gex in cell_gex.items() if gex < 0]
+        max_pos_strike = max(positive, key=lambda p: p[0])[1] if positive else None
+        max_neg_strike = min(negative, key=lambda n: n[0])[1] if negative else None
 
         return max_pos_strike, max_neg_strike
 
+    def test_aggregate_nets_calls_and_puts_per_strike(self):
+        contracts = [
+            {'strike': 590, 'gamma': 0.05, 'oi': 1000, 'spot': 590, 'type': 'CALL'},
+            {'strike': 590, 'gamma': 0.02, 'oi': 1000, 'spot': 590, 'type': 'PUT'},
+            {'strike': 600, 'gamma': 0.01, 'oi': 1000, 'spot': 590, 'type': 'CALL'},
+        ]
+        totals = aggregate_gex_by_strike(contracts)
+        assert totals[590] == pytest.approx(compute_gex(0.03, 1000, 590, 'CALL'))
+        assert totals[600] == pytest.approx(compute_gex(0.01, 1000, 590, 'CALL'))
+        assert len(totals) == 2
+
     def test_simple_star_levels(self):
         contracts = [
             {'strike': 590, 'gamma': 0.05, 'oi': 50000, 'spot': 590, 'type': 'CALL'},
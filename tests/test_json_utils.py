@@ -0,0 +1,49 @@
+"""
+Tests for JSON Serialization Helpers
+======================================
+Verifies json_utils.dumps/loads round-trip dashboard payloads with either backend.
+"""
+
+import pytest
+import json
+
+import json_utils
+
+
+@pytest.fixture(params=['orjson', 'stdlib'])
+def backend(request, monkeypatch):
+    if request.param == 'stdlib':
+        monkeypatch.setattr(json_utils, 'orjson', None)
+    elif json_utils.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+class TestDumps:
+    def test_returns_bytes(self, backend):
+        assert isinstance(json_utils.dumps({'a': 1}), bytes)
+
+    def test_float_strike_keys_become_strings(self, backend):
+        data = {'SPY': {'strikes': {590.0: {'oi': 100}, 595.5: {'oi': 50}}}}
+        assert json.loads(json_utils.dumps(data)) == {
+            'SPY': {'strikes': {'590.0': {'oi': 100}, '595.5': {'oi': 50}}}}
+
+    def test_indent(self, backend):
+        out = json_utils.dumps({'a': [1, 2]}, indent=True).decode()
+        assert out == json.dumps({'a': [1, 2]}, indent=2)
+
+    def test_unicode_round_trip(self, backend):
+        assert json.loads(json_utils.dumps({'s': 'é★'})) == {'s': 'é★'}
+
+
+class TestLoads:
+    @pytest.mark.parametrize("raw", ['[{"a": 1.5}]', b'[{"a": 1.5}]'])
+    def test_str_and_bytes(self, backend, raw):
+        assert json_utils.loads(raw) == [{'a': 1.5}]
+
+    def test_legacy_nan_literal(self, backend):
+        assert json.dumps(json_utils.loads('{"iv": NaN}')) == '{"iv": NaN}'
+
+    def test_invalid_raises_json_error(self, backend):
+        with pytest.raises(json.JSONDecodeError):
+            json_utils.loads('{"a":')
@@ -0,0 +1,52 @@
+"""
+Tests for Structured Logging
+=============================
+Verifies the cached-timestamp formatter matches the stock Formatter output.
+"""
+
+import logging
+import threading
+
+from logger import _CachedTimeFormatter, LOG_FORMAT, DATE_FORMAT
+
+
+def _record(created, msg="hello"):
+    record = logging.LogRecord("trading", logging.INFO, __file__, 1, msg, None, None)
+    record.created = created
+    return record
+
+
+class TestCachedTimeFormatter:
+    def test_matches_stock_formatter(self):
+        stock = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+        cached = _CachedTimeFormatter()
+        for created in (1760000000.1, 1760000000.9, 1760000001.2, 1760003600.0):
+            record = _record(created)
+            assert cached.format(record) == stock.format(record)
+
+    def test_reuses_time_within_same_second(self, monkeypatch):
+        cached = _CachedTimeFormatter()
+        calls = []
+        real = cached.converter
+        monkeypatch.setattr(cached, 'converter', lambda t: calls.append(t) or real(t))
+        for created in (1760000000.1, 1760000000.5, 1760000000.9):
+            cached.format(_record(created))
+        assert len(calls) == 1
+
+    def test_concurrent_records_get_their_own_second(self):
+        cached = _CachedTimeFormatter()
+        stock = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+        records = [_record(1760000000.5 + i % 7) for i in range(2000)]
+        mismatches = []
+
+        def worker(chunk):
+            for record in chunk:
+                if cached.formatTime(record) != stock.formatTime(record, DATE_FORMAT):
+                    mismatches.append(record.created)
+
+        threads = [threading.Thread(target=worker, args=(records[i::4],)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert mismatches == []
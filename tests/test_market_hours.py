@@ -0,0 +1,59 @@
+"""
+Tests for Market Hours Runner
+==============================
+Verifies next-open computation and the single sleep in wait_for_market_open.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+import market_hours_runner as mhr
+from market_hours_runner import next_market_open, MARKET_OPEN, _ET
+
+
+def _et(*args):
+    return datetime(*args, tzinfo=_ET)
+
+
+class TestNextMarketOpen:
+    @pytest.mark.parametrize("now,expected_day", [
+        (_et(2026, 10, 14, 8, 0), (2026, 10, 14)),    # Wednesday before open
+        (_et(2026, 10, 14, 17, 0), (2026, 10, 15)),   # Wednesday after close
+        (_et(2026, 10, 16, 17, 0), (2026, 10, 19)),   # Friday after close
+        (_et(2026, 10, 17, 12, 0), (2026, 10, 19)),   # Saturday
+        (_et(2026, 10, 18, 23, 0), (2026, 10, 19)),   # Sunday night
+    ])
+    def test_rolls_to_next_weekday_open(self, now, expected_day):
+        expected = datetime.combine(datetime(*expected_day).date(), MARKET_OPEN, tzinfo=_ET)
+        assert next_market_open(now) == expected
+
+
+class TestWaitForMarketOpen:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Fake ET wall clock; each sleep advances it by `sleep_drift` times the duration."""
+        state = {'now': _et(2026, 10, 17, 12, 0), 'sleep_drift': 1, 'sleeps': []}  # Saturday noon
+        open_at = next_market_open(state['now'])
+
+        def fake_sleep(seconds):
+            state['sleeps'].append(seconds)
+            state['now'] += timedelta(seconds=seconds * state['sleep_drift'])
+
+        monkeypatch.setattr(mhr, 'datetime', type('FixedDatetime', (datetime,), {
+            'now': classmethod(lambda cls, tz=None: state['now'])}))
+        monkeypatch.setattr(mhr, 'is_market_hours', lambda: state['now'] >= open_at)
+        monkeypatch.setattr(mhr.time, 'sleep', fake_sleep)
+        state['open_at'] = open_at
+        return state
+
+    def test_sleeps_in_bounded_chunks_until_open(self, clock):
+        start = clock['now']
+        mhr.wait_for_market_open()
+        assert max(clock['sleeps']) <= mhr.MAX_WAIT_SECONDS
+        assert sum(clock['sleeps']) == clock['open_at'].timestamp() - start.timestamp()
+
+    def test_rechecks_clock_after_suspend(self, clock):
+        # A host suspend makes the wall clock jump far past the requested sleep
+        clock['sleep_drift'] = 100
+        mhr.wait_for_market_open()
+        assert clock['sleeps'] == [mhr.MAX_WAIT_SECONDS]
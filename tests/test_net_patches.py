@@ -0,0 +1,31 @@
+"""
+Tests for Network Patches
+==========================
+Verifies the api.schwabapi.com getaddrinfo pin.
+"""
+
+import socket
+
+import net_patches
+
+
+class TestGetaddrinfoPatch:
+    def test_installed_once(self):
+        net_patches.install()
+        net_patches.install()
+        assert socket.getaddrinfo is net_patches.patched_getaddrinfo
+
+    def test_schwab_https_pinned(self):
+        result = socket.getaddrinfo('api.schwabapi.com', 443)
+        assert result == [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('69.192.139.216', 443))]
+
+    def test_schwab_other_port(self):
+        result = socket.getaddrinfo('api.schwabapi.com', 8443)
+        assert result[0][4] == ('69.192.139.216', 8443)
+
+    def test_other_hosts_delegate(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(net_patches, '_original_getaddrinfo',
+                            lambda *args: calls.append(args) or [])
+        socket.getaddrinfo('example.com', 443)
+        assert calls == [('example.com', 443, 0, 0, 0, 0)]
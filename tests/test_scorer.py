@@ -6,10 +6,6 @@ Uses deterministic test inputs — production scorer uses only Schwab API data.
 """
 
 import pytest
-import sys
-import os
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from agent.scorer import (
     _score_gex_regime,
@@ -29,39 +25,33 @@ from agent.scorer import (
 )
 
 
+_CONTRACT_TEMPLATE = {'Vega': 0.15, 'Theta': -0.05}
+_STRIKE_TEMPLATE = {
+    'total_gamma': 0.02 * 10000,
+    'total_delta': 0.5 * 10000,
+    'total_vega': 0.15 * 10000,
+    'total_theta': -0.05 * 10000,
+    'oi': 18000, 'volume': 3000,
+}
+
+
 def make_contracts(ticker='SPY', price=590, call_oi=10000, put_oi=8000,
                    gamma=0.02, delta=0.5, volume=1500, expiration='2026-02-21'):
-    """Generate a set of test contracts near ATM."""
-    contracts = []
-    for strike_offset in range(-5, 6):
-        strike = price + strike_offset
-        contracts.append({
-            'Symbol': ticker, 'Strike': strike, 'Type': 'CALL',
-            'OpenInterest': call_oi, 'Gamma': gamma, 'Delta': delta,
-            'Vega': 0.15, 'Theta': -0.05, 'Volume': volume,
-            'UnderlyingPrice': price, 'Expiration': expiration,
-        })
-        contracts.append({
-            'Symbol': ticker, 'Strike': strike, 'Type': 'PUT',
-            'OpenInterest': put_oi, 'Gamma': gamma, 'Delta': -delta,
-            'Vega': 0.15, 'Theta': -0.05, 'Volume': volume,
-            'UnderlyingPrice': price, 'Expiration': expiration,
-        })
-    return contracts
+    """Generate a set of test contracts near ATM (a CALL and a PUT per strike)."""
+    common = {**_CONTRACT_TEMPLATE, 'Symbol': ticker, 'Gamma': gamma, 'Volume': volume,
+              'UnderlyingPrice': price, 'Expiration': expiration}
+    legs = (('CALL', call_oi, delta), ('PUT', put_oi, -delta))
+    return [
+        {**common, 'Strike': price + offset, 'Type': opt_type,
+         'OpenInterest': oi, 'Delta': leg_delta}
+        for offset in range(-5, 6)
+        for opt_type, oi, leg_delta in legs
+    ]
 
 
 def make_analytics(price=590):
     """Generate test analytics data."""
-    strikes = {}
-    for offset in range(-5, 6):
-        s = price + offset
-        strikes[s] = {
-            'total_gamma': 0.02 * 10000,
-            'total_delta': 0.5 * 10000,
-            'total_vega': 0.15 * 10000,
-            'total_theta': -0.05 * 10000,
-            'oi': 18000, 'volume': 3000,
-        }
+    strikes = {price + offset: dict(_STRIKE_TEMPLATE) for offset in range(-5, 6)}
     return {'price': price, 'strikes': strikes}
 
 
@@ -74,6 +64,22 @@ def make_gamma_levels(pos_strike=595, neg_strike=580, pos_gex=1000000, neg_gex=-
     }
 
 
+# Default inputs, built once; the scorers only read them
+@pytest.fixture(scope="module")
+def default_contracts():
+    return make_contracts()
+
+
+@pytest.fixture(scope="module")
+def default_analytics():
+    return make_analytics()
+
+
+@pytest.fixture(scope="module")
+def default_gamma_levels():
+    return make_gamma_levels()
+
+
 # ─── Weight Tests ───
 
 class TestWeights:
@@ -87,27 +93,26 @@ class TestWeights:
     def test_nine_signals(self):
         assert len(WEIGHTS) == 9
 
+    def test_read_only(self):
+        with pytest.raises(TypeError):
+            WEIGHTS['gex_regime'] = 0
+
 
 # ─── GEX Regime (adaptive percentile) ───
 
 class TestGexRegimeScorer:
-    def test_positive_gex(self):
-        s = _score_gex_regime(5_000_000, percentile=0.9)
+    @pytest.mark.parametrize("gex,regime", [
+        (5_000_000, "POSITIVE"),
+        (-5_000_000, "NEGATIVE"),
+    ])
+    def test_regime(self, gex, regime):
+        s = _score_gex_regime(gex, percentile=0.9)
         assert 0 < s.score <= 20
-        assert "POSITIVE" in s.detail
-
-    def test_negative_gex(self):
-        s = _score_gex_regime(-5_000_000, percentile=0.9)
-        assert 0 < s.score <= 20
-        assert "NEGATIVE" in s.detail
-
-    def test_zero_gex(self):
-        s = _score_gex_regime(0)
-        assert s.score == 0
+        assert regime in s.detail
 
-    def test_none_gex(self):
-        s = _score_gex_regime(None)
-        assert s.score == 0
+    @pytest.mark.parametrize("gex", [0, None])
+    def test_no_gex_scores_zero(self, gex):
+        assert _score_gex_regime(gex).score == 0
 
     def test_extreme_percentile_scores_higher(self):
         low = _score_gex_regime(1_000_000, percentile=0.5)
@@ -122,21 +127,15 @@ class TestGexRegimeScorer:
 # ─── Wall Proximity ───
 
 class TestWallProximityScorer:
-    def test_at_call_wall(self):
-        s = _score_wall_proximity(590, 590, 570)
-        assert s.score >= 12
-
-    def test_far_from_walls(self):
-        s = _score_wall_proximity(590, 650, 530)
-        assert s.score <= 5
-
-    def test_no_price(self):
-        s = _score_wall_proximity(0, 590, 580)
-        assert s.score == 0
-
-    def test_no_walls(self):
-        s = _score_wall_proximity(590, None, None)
-        assert s.score <= 5
+    @pytest.mark.parametrize("price,call_wall,put_wall,in_range", [
+        pytest.param(590, 590, 570, lambda score: score >= 12, id='at_call_wall'),
+        pytest.param(590, 650, 530, lambda score: score <= 5, id='far_from_walls'),
+        pytest.param(0, 590, 580, lambda score: score == 0, id='no_price'),
+        pytest.param(590, None, None, lambda score: score <= 5, id='no_walls'),
+    ])
+    def test_wall_proximity(self, price, call_wall, put_wall, in_range):
+        s = _score_wall_proximity(price, call_wall, put_wall)
+        assert in_range(s.score)
 
 
 # ─── P/C Skew (DTE-weighted) ───
@@ -162,9 +161,8 @@ class TestPcSkewScorer:
         s = _score_pc_skew([], 590)
         assert s.score == 0
 
-    def test_dte_weighted_label(self):
-        contracts = make_contracts()
-        s = _score_pc_skew(contracts, 590)
+    def test_dte_weighted_label(self, default_contracts):
+        s = _score_pc_skew(default_contracts, 590)
         assert "DTE-weighted" in s.detail
 
 
@@ -185,31 +183,24 @@ class TestVolOiSurgeScorer:
 # ─── IV Rank (replaces raw vega) ───
 
 class TestIvRankScorer:
-    def test_high_iv(self):
-        s = _score_iv_rank(0.9)
-        assert s.score > 5
-        assert "HIGH" in s.detail
-
-    def test_low_iv(self):
-        s = _score_iv_rank(0.15)
-        assert s.score > 3
-        assert "LOW" in s.detail
-
-    def test_mid_iv(self):
-        s = _score_iv_rank(0.5)
-        assert s.score <= 3  # less extreme = lower score
-
-    def test_none_iv(self):
-        s = _score_iv_rank(None)
-        assert s.score == 0
+    @pytest.mark.parametrize("iv_rank,in_range,label", [
+        pytest.param(0.9, lambda score: score > 5, "HIGH", id='high_iv'),
+        pytest.param(0.15, lambda score: score > 3, "LOW", id='low_iv'),
+        pytest.param(0.5, lambda score: score <= 3, None, id='mid_iv'),  # less extreme = lower score
+        pytest.param(None, lambda score: score == 0, None, id='none_iv'),
+    ])
+    def test_iv_rank(self, iv_rank, in_range, label):
+        s = _score_iv_rank(iv_rank)
+        assert in_range(s.score)
+        if label:
+            assert label in s.detail
 
 
 # ─── Directional Bias ───
 
 class TestDirectionalBiasScorer:
-    def test_bullish_delta(self):
-        analytics = make_analytics()
-        s = _score_directional_bias(analytics, 590)
+    def test_bullish_delta(self, default_analytics):
+        s = _score_directional_bias(default_analytics, 590)
         assert s.score > 0
         assert "BULLISH" in s.detail
 
@@ -253,27 +244,24 @@ class TestSkewMomentumScorer:
         s = _score_skew_momentum(contracts, 590, previous_pc_ratio=1.0)
         assert s.score > 0
 
-    def test_without_previous(self):
-        contracts = make_contracts()
-        s = _score_skew_momentum(contracts, 590, previous_pc_ratio=None)
+    def test_without_previous(self, default_contracts):
+        s = _score_skew_momentum(default_contracts, 590, previous_pc_ratio=None)
         assert s.score >= 0
 
 
 # ─── DTE Conviction (NEW) ───
 
 class TestDteConviction:
-    def test_high_multiplier(self):
-        s = _score_dte_conviction(1.45)
-        assert s.score >= 6
-        assert "0-2 DTE" in s.detail
-
-    def test_low_multiplier(self):
-        s = _score_dte_conviction(0.6)
-        assert s.score <= 2
-
-    def test_standard_multiplier(self):
-        s = _score_dte_conviction(1.0)
-        assert 2 <= s.score <= 5
+    @pytest.mark.parametrize("multiplier,in_range,label", [
+        pytest.param(1.45, lambda score: score >= 6, "0-2 DTE", id='high_multiplier'),
+        pytest.param(0.6, lambda score: score <= 2, None, id='low_multiplier'),
+        pytest.param(1.0, lambda score: 2 <= score <= 5, None, id='standard_multiplier'),
+    ])
+    def test_conviction(self, multiplier, in_range, label):
+        s = _score_dte_conviction(multiplier)
+        assert in_range(s.score)
+        if label:
+            assert label in s.detail
 
 
 # ─── DTE Weight Computation ───
@@ -297,28 +285,23 @@ class TestDteWeight:
 # ─── Integration Tests ───
 
 class TestScoreTicker:
-    def test_returns_recommendation(self):
-        contracts = make_contracts()
-        analytics = make_analytics()
-        gamma = make_gamma_levels()
-        rec = score_ticker('SPY', contracts, analytics, gamma)
+    def test_returns_recommendation(self, default_contracts, default_analytics, default_gamma_levels):
+        rec = score_ticker('SPY', default_contracts, default_analytics, default_gamma_levels)
         assert isinstance(rec, Recommendation)
         assert rec.ticker == 'SPY'
         assert 0 <= rec.score <= 100
         assert rec.direction in ('BULLISH', 'BEARISH', 'NEUTRAL')
         assert len(rec.signals) == 9  # 9 signals now
 
-    def test_with_historical_context(self):
-        contracts = make_contracts()
-        analytics = make_analytics()
-        gamma = make_gamma_levels()
+    def test_with_historical_context(self, default_contracts, default_analytics,
+                                     default_gamma_levels):
         hist = {
             'gex_percentile': 0.85,
             'momentum': {'gex_trend': 0.3, 'gex_samples': 5, 'gex_start': 100, 'gex_end': 130},
             'iv_rank': 0.75,
             'previous_pc_ratio': 1.1,
         }
-        rec = score_ticker('SPY', contracts, analytics, gamma, hist)
+        rec = score_ticker('SPY', default_contracts, default_analytics, default_gamma_levels, hist)
         assert rec.score > 0
         assert rec.iv_rank_value == 0.75
         assert rec.price_at_score > 0
@@ -328,11 +311,8 @@ class TestScoreTicker:
         assert rec.score <= 10  # small base from neutral defaults (IV rank, DTE)
         assert rec.ticker == 'SPY'
 
-    def test_has_reasoning(self):
-        contracts = make_contracts()
-        analytics = make_analytics()
-        gamma = make_gamma_levels()
-        rec = score_ticker('SPY', contracts, analytics, gamma)
+    def test_has_reasoning(self, default_contracts, default_analytics, default_gamma_levels):
+        rec = score_ticker('SPY', default_contracts, default_analytics, default_gamma_levels)
         assert len(rec.reasoning) > 10
         assert len(rec.risk_notes) > 0
 
@@ -353,11 +333,8 @@ class TestScoreAllTickers:
         recs = score_all_tickers([], {}, {})
         assert recs == []
 
-    def test_to_dict(self):
-        contracts = make_contracts()
-        analytics = make_analytics()
-        gamma = make_gamma_levels()
-        rec = score_ticker('SPY', contracts, analytics, gamma)
+    def test_to_dict(self, default_contracts, default_analytics, default_gamma_levels):
+        rec = score_ticker('SPY', default_contracts, default_analytics, default_gamma_levels)
         d = rec.to_dict()
         assert isinstance(d, dict)
         assert d['ticker'] == 'SPY'
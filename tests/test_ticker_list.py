@@ -0,0 +1,44 @@
+"""
+Tests for Ticker Lists
+=======================
+Verifies the combined ticker universe stays consistent with its categories.
+"""
+
+import pytest
+
+from ticker_list import ALL_TICKERS, TICKER_CATEGORIES, TICKER_SET, TOP_100_LIQUID_OPTIONS
+
+
+class TestAllTickers:
+    def test_sorted_and_unique(self):
+        assert list(ALL_TICKERS) == sorted(set(ALL_TICKERS))
+
+    def test_matches_categories(self):
+        expected = set()
+        for tickers in TICKER_CATEGORIES.values():
+            expected.update(tickers)
+        assert set(ALL_TICKERS) == expected
+
+    def test_ticker_set_matches(self):
+        assert isinstance(TICKER_SET, frozenset)
+        assert TICKER_SET == set(ALL_TICKERS)
+
+    def test_lists_are_immutable(self):
+        assert isinstance(ALL_TICKERS, tuple)
+        assert isinstance(TOP_100_LIQUID_OPTIONS, tuple)
+        assert all(isinstance(t, tuple) for t in TICKER_CATEGORIES.values())
+
+
+class TestTopLiquid:
+    def test_no_duplicates(self):
+        assert len(set(TOP_100_LIQUID_OPTIONS)) == len(TOP_100_LIQUID_OPTIONS)
+
+    def test_index_symbols_use_dollar_prefix(self):
+        assert '$SPX' in TOP_100_LIQUID_OPTIONS
+        assert 'SPX' not in TOP_100_LIQUID_OPTIONS
+
+
+class TestTickerCategories:
+    def test_read_only(self):
+        with pytest.raises(TypeError):
+            TICKER_CATEGORIES['New'] = ('XYZ',)